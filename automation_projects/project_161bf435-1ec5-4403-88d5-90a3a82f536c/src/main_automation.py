@@ -85,12 +85,6 @@ def main():
         # Execute the automation code
         try:
             # Generic Automation
-            import time
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
             # Navigate to website
             driver.get("https://httpbin.org/html")
             
@@ -33,20 +33,19 @@ try:
     title = driver.title
     print(f"Page title: {title}")
     
-    # Find interactive elements
-    buttons = driver.find_elements(By.TAG_NAME, "button")
-    inputs = driver.find_elements(By.TAG_NAME, "input")
-    links = driver.find_elements(By.TAG_NAME, "a")
+    # Count interactive elements in a single browser round-trip
+    counts = driver.execute_script(
+        "return [document.getElementsByTagName('button').length,"
+        "document.getElementsByTagName('input').length,"
+        "document.getElementsByTagName('a').length];"
+    )
     
-    print(f"Found {len(buttons)} buttons, {len(inputs)} inputs, {len(links)} links")
+    print(f"Found {counts[0]} buttons, {counts[1]} inputs, {counts[2]} links")
     
     # Take screenshot
     driver.save_screenshot("automation_screenshot.png")
     print("Screenshot saved")
     
-    # Wait and observe
-    time.sleep(5)
-    
     print("Automation completed successfully")
 
 except Exception as e:
@@ -6,6 +6,8 @@ Workflow ID: 51f21155-9114-404a-b2d1-653032288208
 
 import os
 import sys
+import json
+import asyncio
 import subprocess
 from pathlib import Path
 
@@ -38,19 +40,72 @@ def run_tests():
     """Run test suite."""
     print("🧪 Running tests...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pytest", "tests/", "-v"])
+        subprocess.check_call([sys.executable, "-m", "pytest", "tests/", "-v", "-n", "auto", "--dist=loadfile"])
         print("✅ All tests passed")
     except subprocess.CalledProcessError as e:
         print(f"⚠️ Some tests failed: {e}")
 
-def run_automation():
-    """Run the main automation script."""
+def _write_status(project_dir, status):
+    """Atomically write a project's run status to results/<project>_status.json."""
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+    target = results_dir / f"{Path(project_dir).resolve().name}_status.json"
+    tmp_file = target.with_suffix(".json.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(status, f, indent=2)
+    os.replace(tmp_file, target)
+
+async def _run_project(project_dir, semaphore):
+    """Run one project's automation script as a subprocess."""
+    async with semaphore:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "src/main_automation.py",
+            cwd=str(project_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+    
+    status = {
+        "project": str(project_dir),
+        "returncode": process.returncode,
+        "stdout": stdout.decode(errors="replace"),
+        "stderr": stderr.decode(errors="replace"),
+    }
+    _write_status(project_dir, status)
+    return status
+
+def _print_output(status, prefix):
+    """Print a finished project's captured output, each line prefixed when several ran."""
+    for stream, target in (("stdout", sys.stdout), ("stderr", sys.stderr)):
+        for line in status[stream].splitlines():
+            print(f"{prefix}{line}", file=target)
+
+async def _run_projects(project_dirs):
+    """Run several projects concurrently, reporting each as it finishes."""
+    semaphore = asyncio.Semaphore(min(os.cpu_count() or 1, 8))
+    tasks = [_run_project(project_dir, semaphore) for project_dir in project_dirs]
+    results = []
+    for finished in asyncio.as_completed(tasks):
+        status = await finished
+        # Output is buffered per project, so blocks from parallel runs never interleave
+        prefix = f"[{Path(status['project']).resolve().name}] " if len(tasks) > 1 else ""
+        _print_output(status, prefix)
+        if status["returncode"] == 0:
+            print(f"✅ Automation completed: {status['project']}")
+        else:
+            print(f"❌ Automation failed ({status['returncode']}): {status['project']}")
+        results.append(status)
+    return results
+
+def run_automation(project_dirs=None):
+    """Run the main automation script for one or more project directories."""
     print("🚀 Starting automation...")
-    try:
-        subprocess.check_call([sys.executable, "src/main_automation.py"])
-        print("✅ Automation completed")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Automation failed: {e}")
+    if not project_dirs:
+        project_dirs = [Path.cwd()]
+    
+    results = asyncio.run(_run_projects(project_dirs))
+    return all(status["returncode"] == 0 for status in results)
 
 def main():
     """Main setup function."""
@@ -85,4 +140,7 @@ def main():
         print("❌ Invalid choice")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # python setup.py <project_dir> [<project_dir> ...] runs automations in parallel
+        sys.exit(0 if run_automation([Path(p) for p in sys.argv[1:]]) else 1)
     main()
@@ -11,8 +11,17 @@ Workflow ID: 51f21155-9114-404a-b2d1-653032288208
 """
 
 import os
+import copy
 from pathlib import Path
 
+# Flags shared by every Chrome/Edge launch
+_BASE_BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--start-maximized",
+)
+
 class Config:
     """Configuration class for automation project."""
     
@@ -41,53 +50,100 @@ class Config:
     WINDOW_SIZE = (1920, 1080)
     IMPLICIT_WAIT = 10
     EXPLICIT_WAIT = 30
+    PAGE_LOAD_STRATEGY = "eager"  # normal, eager or none
+    DISABLE_IMAGES = True
     
     # Execution settings
     MAX_RETRIES = 5
     RETRY_DELAY = 2
     SCREENSHOT_ON_ERROR = True
+    SCREENSHOT_FORMAT = "jpeg"  # jpeg (fast, via CDP) or png (lossless)
+    SCREENSHOT_QUALITY = 70
     SAVE_EXECUTION_LOGS = True
     
     # Output settings
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Built browser options, keyed by browser and the settings they depend on
+    _options_cache = {}
+    
     @classmethod
     def setup_directories(cls):
         """Create necessary directories."""
+        from utils import ensure_directory
         for directory in [cls.LOGS_DIR, cls.SCREENSHOTS_DIR, cls.RESULTS_DIR]:
-            directory.mkdir(exist_ok=True)
+            ensure_directory(directory)
+    
+    @classmethod
+    def _options_key(cls):
+        """Settings the browser options are derived from."""
+        return (cls.HEADLESS, tuple(cls.WINDOW_SIZE), cls.PAGE_LOAD_STRATEGY, cls.DISABLE_IMAGES)
+    
+    @classmethod
+    def _cached_options(cls, browser, builder):
+        """Return a copy of the cached options, rebuilding them when settings change."""
+        key = (browser, cls._options_key())
+        options = cls._options_cache.get(key)
+        if options is None:
+            options = cls._options_cache[key] = builder()
+        # Options are mutable and consumed by Selenium, hand out a private copy
+        return copy.deepcopy(options)
     
     @classmethod
     def get_chrome_options(cls):
         """Get Chrome browser options."""
+        return cls._cached_options("chrome", cls._build_chrome_options)
+    
+    @classmethod
+    def get_edge_options(cls):
+        """Get Edge browser options."""
+        return cls._cached_options("edge", cls._build_edge_options)
+    
+    @classmethod
+    def _build_chrome_options(cls):
+        """Build Chrome browser options."""
         from selenium.webdriver.chrome.options import Options
         options = Options()
         
         if cls.HEADLESS:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
         
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
+        for argument in _BASE_BROWSER_ARGS:
+            options.add_argument(argument)
+        # Window size is part of the options cache key, so this is formatted once per size
         options.add_argument(f"--window-size={cls.WINDOW_SIZE[0]},{cls.WINDOW_SIZE[1]}")
-        options.add_argument("--start-maximized")
+        
+        options.page_load_strategy = cls.PAGE_LOAD_STRATEGY
+        if cls.DISABLE_IMAGES:
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.add_argument("--blink-settings=imagesEnabled=false")
         
         return options
     
     @classmethod
-    def get_edge_options(cls):
-        """Get Edge browser options."""
+    def _build_edge_options(cls):
+        """Build Edge browser options."""
         from selenium.webdriver.edge.options import Options
         options = Options()
         
         if cls.HEADLESS:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
         
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
+        for argument in _BASE_BROWSER_ARGS:
+            options.add_argument(argument)
+        # Window size is part of the options cache key, so this is formatted once per size
         options.add_argument(f"--window-size={cls.WINDOW_SIZE[0]},{cls.WINDOW_SIZE[1]}")
-        options.add_argument("--start-maximized")
+        
+        options.page_load_strategy = cls.PAGE_LOAD_STRATEGY
+        if cls.DISABLE_IMAGES:
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.add_argument("--blink-settings=imagesEnabled=false")
         
         return options
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Launch a long-lived Chrome instance that automation runs can attach to
+over the DevTools protocol (see setup_shared_chrome_driver).
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+
+CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+
+def find_chrome():
+    """Find a Chrome/Chromium executable."""
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+def main():
+    """Start the shared browser and wait until it exits."""
+    chrome = find_chrome()
+    if not chrome:
+        print("ERROR: Chrome/Chromium executable not found")
+        return 1
+    
+    port = os.environ.get("AUTOMATION_CDP_PORT", "9222")
+    profile_dir = os.environ.get("AUTOMATION_SHARED_PROFILE", "/tmp/shared_profile")
+    
+    args = [
+        chrome,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={profile_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-dev-shm-usage",
+    ]
+    if "--headless" in sys.argv:
+        args.append("--headless=new")
+    
+    print(f"Starting shared browser on 127.0.0.1:{port}")
+    print(f"Set AUTOMATION_CDP_ENDPOINT=127.0.0.1:{port} for automation runs")
+    return subprocess.call(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
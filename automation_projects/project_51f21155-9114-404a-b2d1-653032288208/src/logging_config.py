@@ -2,6 +2,8 @@
 Logging configuration for automation project
 """
 
+import queue
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
@@ -22,21 +24,35 @@ def setup_project_logging(log_level: str = "INFO", log_file: str = None):
     # Configure logging format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
     
+    # File handler with rotation and console handler; both run on a background
+    # listener thread so callers only pay for a queue put
+    formatter = logging.Formatter(log_format)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The listener's handlers apply the real format; the queue handler only
+    # merges the message arguments
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=[
-            # File handler with rotation
-            logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=10*1024*1024,  # 10MB
-                backupCount=5,
-                encoding='utf-8'
-            ),
-            # Console handler
-            logging.StreamHandler()
-        ]
+        handlers=[queue_handler]
     )
     
     # Configure specific loggers
@@ -50,9 +66,7 @@ def setup_project_logging(log_level: str = "INFO", log_file: str = None):
     automation_logger = logging.getLogger('automation')
     automation_logger.setLevel(getattr(logging, log_level.upper()))
     
-    logging.info("Logging configuration completed")
-    logging.info(f"Log file: {log_file}")
-    logging.info(f"Log level: {log_level}")
+    logging.info("Logging configured: file=%s level=%s", log_file, log_level)
     
     return automation_logger
 
@@ -64,33 +78,41 @@ class AutomationLogger:
     
     def step(self, message: str):
         """Log an automation step."""
-        self.logger.info(f"STEP: {message}")
-        print(f"🔹 {message}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("STEP: %s", message)
+            print(f"🔹 {message}")
     
     def success(self, message: str):
         """Log a success message."""
-        self.logger.info(f"SUCCESS: {message}")
-        print(f"✅ {message}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("SUCCESS: %s", message)
+            print(f"✅ {message}")
     
     def error(self, message: str):
         """Log an error message."""
-        self.logger.error(f"ERROR: {message}")
-        print(f"❌ {message}")
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error("ERROR: %s", message)
+            print(f"❌ {message}")
     
     def warning(self, message: str):
         """Log a warning message."""
-        self.logger.warning(f"WARNING: {message}")
-        print(f"⚠️ {message}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("WARNING: %s", message)
+            print(f"⚠️ {message}")
     
     def retry(self, message: str, attempt: int, max_attempts: int):
         """Log a retry attempt."""
-        self.logger.warning(f"RETRY {attempt}/{max_attempts}: {message}")
-        print(f"🔄 Retry {attempt}/{max_attempts}: {message}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("RETRY %d/%d: %s", attempt, max_attempts, message)
+            print(f"🔄 Retry {attempt}/{max_attempts}: {message}")
     
     def browser_action(self, action: str, element: str = ""):
         """Log a browser action."""
-        message = f"BROWSER: {action}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if element:
-            message += f" on {element}"
-        self.logger.info(message)
-        print(f"🌐 {message}")
+            self.logger.info("BROWSER: %s on %s", action, element)
+            print(f"🌐 BROWSER: {action} on {element}")
+        else:
+            self.logger.info("BROWSER: %s", action)
+            print(f"🌐 BROWSER: {action}")
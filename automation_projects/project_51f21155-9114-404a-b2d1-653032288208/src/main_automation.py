@@ -12,13 +12,19 @@ Generated: 2025-05-30 18:04:52
 """
 
 import os
+import json
 import time
+import socket
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.common.exceptions import SessionNotCreatedException
+
+from utils import take_screenshot
 
 # WebDriver Manager imports with fallback
 try:
@@ -28,6 +34,57 @@ try:
 except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
 
+# Resolved driver binaries, shared across runs so webdriver-manager only hits
+# the network when no usable pinned path exists
+_DRIVER_PATH_CACHE = {}
+_DRIVER_PINS_FILE = Path.home() / ".cache" / "automation" / "driver_pins.json"
+
+def _load_driver_pins():
+    """Load pinned driver paths from disk."""
+    try:
+        with open(_DRIVER_PINS_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_driver_pin(browser, path):
+    """Persist a resolved driver path for subsequent processes."""
+    try:
+        pins = _load_driver_pins()
+        pins[browser] = path
+        _DRIVER_PINS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DRIVER_PINS_FILE, "w", encoding="utf-8") as f:
+            json.dump(pins, f, indent=2)
+    except OSError as e:
+        print(f"Could not persist driver pin: {e}")
+
+def get_driver_path(browser, manager_factory, refresh=False):
+    """Return a driver path, reusing the cached/pinned one when it still exists.
+    
+    refresh=True skips the pin and re-resolves through webdriver-manager.
+    """
+    use_local = not refresh and os.environ.get("WDM_LOCAL", "1") != "0"
+    
+    if use_local:
+        path = _DRIVER_PATH_CACHE.get(browser) or _load_driver_pins().get(browser)
+        if path and os.path.exists(path):
+            _DRIVER_PATH_CACHE[browser] = path
+            return path
+    
+    path = manager_factory().install()
+    _DRIVER_PATH_CACHE[browser] = path
+    _save_driver_pin(browser, path)
+    return path
+
+def start_pinned_driver(browser, manager_factory, create):
+    """Start a driver via create(driver_path), re-resolving the pin once if the browser rejects it."""
+    try:
+        return create(get_driver_path(browser, manager_factory))
+    except SessionNotCreatedException as e:
+        # Usually the browser updated and the pinned driver no longer matches its version
+        print(f"Pinned {browser} driver rejected, re-resolving: {e.msg}")
+        return create(get_driver_path(browser, manager_factory, refresh=True))
+
 def setup_chrome_driver():
     """Setup Chrome driver with fallback."""
     try:
@@ -37,17 +94,60 @@ def setup_chrome_driver():
         options.add_argument('--disable-gpu')
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--start-maximized")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # The script only reads the title and counts DOM tags, DOMContentLoaded is enough
+        options.page_load_strategy = "eager"
         
         if WEBDRIVER_MANAGER_AVAILABLE:
             from selenium.webdriver.chrome.service import Service
-            service = Service(ChromeDriverManager().install())
-            return webdriver.Chrome(service=service, options=options)
+            return start_pinned_driver(
+                "chrome", ChromeDriverManager,
+                lambda path: webdriver.Chrome(service=Service(path), options=options)
+            )
         else:
             return webdriver.Chrome(options=options)
     except Exception as e:
         print(f"Chrome setup failed: {e}")
         return None
 
+def _cdp_endpoint_reachable(endpoint):
+    """Quick probe for a browser listening on host:port."""
+    host, _, port = endpoint.rpartition(":")
+    try:
+        with socket.create_connection((host or "127.0.0.1", int(port)), 0.2):
+            return True
+    except (OSError, ValueError):
+        return False
+
+def setup_shared_chrome_driver():
+    """Attach to an already running Chrome (see launch_shared_browser.py) in a new tab."""
+    endpoint = os.environ.get("AUTOMATION_CDP_ENDPOINT", "127.0.0.1:9222")
+    if not _cdp_endpoint_reachable(endpoint):
+        return None
+    
+    try:
+        options = ChromeOptions()
+        options.add_experimental_option("debuggerAddress", endpoint)
+        
+        if WEBDRIVER_MANAGER_AVAILABLE:
+            from selenium.webdriver.chrome.service import Service
+            driver = start_pinned_driver(
+                "chrome", ChromeDriverManager,
+                lambda path: webdriver.Chrome(service=Service(path), options=options)
+            )
+        else:
+            driver = webdriver.Chrome(options=options)
+        
+        driver.switch_to.new_window("tab")
+        return driver
+    except Exception as e:
+        print(f"Shared Chrome attach failed: {e}")
+        return None
+
 def setup_edge_driver():
     """Setup Edge driver with fallback."""
     try:
@@ -55,11 +155,15 @@ def setup_edge_driver():
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.page_load_strategy = "eager"
         
         if WEBDRIVER_MANAGER_AVAILABLE:
             from selenium.webdriver.edge.service import Service
-            service = Service(EdgeChromiumDriverManager().install())
-            return webdriver.Edge(service=service, options=options)
+            return start_pinned_driver(
+                "edge", EdgeChromiumDriverManager,
+                lambda path: webdriver.Edge(service=Service(path), options=options)
+            )
         else:
             return webdriver.Edge(options=options)
     except Exception as e:
@@ -69,11 +173,17 @@ def setup_edge_driver():
 def main():
     """Main automation function."""
     driver = None
+    shared_browser = False
     
     try:
-        # Try Chrome first, fallback to Edge
-        print("Attempting to start Chrome...")
-        driver = setup_chrome_driver()
+        # Reuse a shared browser when one is running, otherwise start Chrome,
+        # falling back to Edge
+        driver = setup_shared_chrome_driver()
+        shared_browser = driver is not None
+        
+        if not driver:
+            print("Attempting to start Chrome...")
+            driver = setup_chrome_driver()
         
         if not driver:
             print("Chrome failed, trying Edge...")
@@ -91,12 +201,6 @@ def main():
         # Execute the automation code
         try:
             # Generic Automation
-            import time
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
             # Navigate to website
             driver.get("https://practicetestautomation.com/practice-test-login/")
             
@@ -125,19 +229,22 @@ def main():
                 title = driver.title
                 print(f"Page title: {title}")
                 
-                # Find interactive elements
-                buttons = driver.find_elements(By.TAG_NAME, "button")
-                inputs = driver.find_elements(By.TAG_NAME, "input")
-                links = driver.find_elements(By.TAG_NAME, "a")
+                # Count interactive elements in a single browser round-trip
+                counts = driver.execute_script(
+                    "return [document.getElementsByTagName('button').length,"
+                    "document.getElementsByTagName('input').length,"
+                    "document.getElementsByTagName('a').length];"
+                )
                 
-                print(f"Found {len(buttons)} buttons, {len(inputs)} inputs, {len(links)} links")
+                print(f"Found {counts[0]} buttons, {counts[1]} inputs, {counts[2]} links")
                 
                 # Take screenshot
-                driver.save_screenshot("automation_screenshot.png")
-                print("Screenshot saved")
-                
-                # Wait and observe
-                time.sleep(5)
+                # Last step of the run, so wait for the write and report the real outcome
+                screenshot_path = take_screenshot(driver, "automation_screenshot", wait=True)
+                if screenshot_path:
+                    print(f"Screenshot saved: {screenshot_path}")
+                else:
+                    print("Screenshot could not be saved")
                 
                 print("Automation completed successfully")
             
@@ -157,8 +264,13 @@ def main():
     finally:
         if driver:
             try:
-                driver.quit()
-                print("Browser closed")
+                if shared_browser:
+                    # Only close our tab, the shared browser stays up
+                    driver.close()
+                    print("Browser tab closed")
+                else:
+                    driver.quit()
+                    print("Browser closed")
             except Exception as e:
                 print(f"Error closing browser: {{e}}")
 
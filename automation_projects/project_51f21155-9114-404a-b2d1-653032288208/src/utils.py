@@ -5,28 +5,102 @@ Utility functions for automation project
 import os
 import json
 import time
+import base64
 import logging
+import weakref
+import itertools
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from config import Config
+
+# orjson is optional; fall back to the standard library encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Second-resolution timestamp cache plus a sequence number so files written
+# within the same second never collide
+_last_stamp = ("", 0)
+_stamp_seq = itertools.count()
+
+def _stamp() -> str:
+    """Return a unique, sortable timestamp for output filenames."""
+    global _last_stamp
+    now = int(time.time())
+    if _last_stamp[1] != now:
+        _last_stamp = (time.strftime("%Y%m%d_%H%M%S", time.localtime(now)), now)
+    return f"{_last_stamp[0]}_{next(_stamp_seq):04d}"
+
+# Directories already created by this process
+_ensured_dirs = set()
+
+def ensure_directory(directory) -> Path:
+    """Create a directory once per process, skipping the mkdir syscalls afterwards."""
+    key = str(directory)
+    if key not in _ensured_dirs:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+    return Path(directory)
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     """Setup logging configuration."""
     from logging_config import setup_project_logging
     return setup_project_logging(log_level, log_file)
 
-def take_screenshot(driver, name: str, directory: str = "screenshots") -> Optional[str]:
-    """Take and save a screenshot."""
+# Single background writer so screenshot disk I/O overlaps with the next browser command
+_screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+
+def _capture_screenshot(driver, image_format: str):
+    """Return (bytes, extension), using a CDP JPEG capture when requested and available."""
+    if image_format == "jpeg":
+        try:
+            result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "jpeg",
+                "quality": Config.SCREENSHOT_QUALITY,
+                "captureBeyondViewport": False
+            })
+            return base64.b64decode(result["data"]), "jpg"
+        except Exception as e:
+            logging.debug("CDP screenshot unavailable, using PNG: %s", e)
+    return driver.get_screenshot_as_png(), "png"
+
+def _write_screenshot(filepath: Path, data: bytes) -> bool:
+    """Write screenshot bytes to disk (runs on the writer thread)."""
     try:
-        screenshot_dir = Path(directory)
-        screenshot_dir.mkdir(exist_ok=True)
+        filepath.write_bytes(data)
+    except OSError as e:
+        logging.error(f"Failed to write screenshot {filepath}: {e}")
+        return False
+    logging.info("Screenshot saved: %s", filepath)
+    return True
+
+def take_screenshot(driver, name: str, directory: str = "screenshots", wait: bool = False) -> Optional[str]:
+    """Take a screenshot and save it in the background.
+    
+    The returned path may not exist yet; pass wait=True to block until the
+    file is written and get None if writing it failed.
+    """
+    try:
+        screenshot_dir = ensure_directory(directory)
+        
+        data, extension = _capture_screenshot(driver, Config.SCREENSHOT_FORMAT)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
+        timestamp = _stamp()
+        filename = f"{name}_{timestamp}.{extension}"
         filepath = screenshot_dir / filename
         
-        driver.save_screenshot(str(filepath))
-        logging.info(f"Screenshot saved: {filepath}")
+        future = _screenshot_writer.submit(_write_screenshot, filepath, data)
+        if wait and not future.result():
+            return None
         return str(filepath)
         
     except Exception as e:
@@ -36,15 +110,23 @@ def take_screenshot(driver, name: str, directory: str = "screenshots") -> Option
 def save_execution_result(result: Dict[str, Any], filename: str, directory: str = "results") -> Optional[str]:
     """Save execution result to JSON file."""
     try:
-        results_dir = Path(directory)
-        results_dir.mkdir(exist_ok=True)
+        results_dir = ensure_directory(directory)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _stamp()
         filename_with_timestamp = f"{filename}_{timestamp}.json"
         filepath = results_dir / filename_with_timestamp
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(
+                result,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+            with open(filepath, 'wb') as f:
+                f.write(data)
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
         
         logging.info(f"Result saved: {filepath}")
         return str(filepath)
@@ -55,9 +137,6 @@ def save_execution_result(result: Dict[str, Any], filename: str, directory: str
 
 def wait_for_element(driver, by, value, timeout=10):
     """Wait for element to be present and return it."""
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    
     try:
         element = WebDriverWait(driver, timeout).until(
             EC.presence_of_element_located((by, value))
@@ -69,9 +148,6 @@ def wait_for_element(driver, by, value, timeout=10):
 
 def wait_for_clickable(driver, by, value, timeout=10):
     """Wait for element to be clickable and return it."""
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    
     try:
         element = WebDriverWait(driver, timeout).until(
             EC.element_to_be_clickable((by, value))
@@ -81,19 +157,55 @@ def wait_for_clickable(driver, by, value, timeout=10):
         logging.error(f"Element not clickable: {by}={value}, error: {e}")
         return None
 
+# document.readyState values at or past each target state
+_READY_STATES = {
+    "interactive": ("interactive", "complete"),
+    "complete": ("complete",),
+}
+
+def wait_for_load_cdp(driver, state: str = "complete", timeout: float = 10) -> bool:
+    """Wait for document.readyState to reach a state, evaluated over CDP on Chromium browsers."""
+    ready_states = _READY_STATES.get(state, ("complete",))
+    
+    try:
+        def page_ready(d):
+            result = d.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {"expression": "document.readyState", "returnByValue": True}
+            )
+            return result.get("result", {}).get("value") in ready_states
+        
+        WebDriverWait(driver, timeout, poll_frequency=0.02).until(page_ready)
+        return True
+    except TimeoutException:
+        logging.warning("Page did not reach readyState %s within %ss", state, timeout)
+        return False
+    except Exception as e:
+        # No CDP on this driver (e.g. Firefox), use the WebDriver script path
+        logging.debug("CDP load wait unavailable, polling readyState: %s", e)
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") in ready_states
+        )
+        return True
+    except Exception as e:
+        logging.warning("Page did not reach readyState %s within %ss: %s", state, timeout, e)
+        return False
+
 def retry_operation(func, max_retries=3, delay=1, *args, **kwargs):
     """Retry an operation with exponential backoff."""
-    for attempt in range(max_retries):
+    # Backoff schedule is fixed up front; the final attempt runs outside the
+    # loop so its exception propagates unchanged
+    wait_times = [delay * (1 << attempt) for attempt in range(max_retries - 1)]
+    for attempt, wait_time in enumerate(wait_times):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            if attempt == max_retries - 1:
-                raise e
-            else:
-                wait_time = delay * (2 ** attempt)
-                logging.warning(f"Operation failed (attempt {attempt + 1}/{max_retries}): {e}")
-                logging.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+            logging.warning("Operation failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
+            logging.info("Retrying in %s seconds...", wait_time)
+            time.sleep(wait_time)
+    return func(*args, **kwargs)
 
 def log_execution_step(step_name: str, details: str = "", level: str = "INFO"):
     """Log an execution step with timestamp."""
@@ -116,32 +228,46 @@ def log_execution_step(step_name: str, details: str = "", level: str = "INFO"):
 def cleanup_old_files(directory: str, max_age_days: int = 7):
     """Clean up old files in a directory."""
     try:
-        dir_path = Path(directory)
-        if not dir_path.exists():
+        if not os.path.isdir(directory):
             return
         
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
+        removed = 0
         
-        for file_path in dir_path.glob("*"):
-            if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                file_path.unlink()
-                logging.info(f"Cleaned up old file: {file_path}")
+        # DirEntry caches file type (and stat on Windows), avoiding a Path per entry
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    removed += 1
+        
+        if removed:
+            logging.info("Cleaned up %d old files in %s", removed, directory)
                 
     except Exception as e:
         logging.error(f"Failed to cleanup old files: {e}")
 
+# Capabilities don't change for the life of a driver, so its info is computed once
+_browser_info_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
 def get_browser_info(driver):
     """Get browser information for logging."""
+    cached = _browser_info_cache.get(driver)
+    if cached is not None:
+        return cached
+    
     try:
         caps = driver.capabilities
         browser_name = caps.get('browserName', 'unknown')
         browser_version = caps.get('version', caps.get('browserVersion', 'unknown'))
         
-        return {
+        info = {
             "name": browser_name,
             "version": browser_version,
             "platform": caps.get('platform', caps.get('platformName', 'unknown'))
         }
+        _browser_info_cache[driver] = info
+        return info
     except Exception as e:
         logging.error(f"Failed to get browser info: {e}")
         return {"name": "unknown", "version": "unknown", "platform": "unknown"}
@@ -0,0 +1,21 @@
+"""
+Pytest configuration for the automation test suite
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from config import Config
+
+@pytest.fixture(autouse=True)
+def worker_scoped_directories(monkeypatch):
+    """Give each pytest-xdist worker its own output directories."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    for attr in ("LOGS_DIR", "SCREENSHOTS_DIR", "RESULTS_DIR"):
+        monkeypatch.setattr(Config, attr, getattr(Config, attr) / worker)
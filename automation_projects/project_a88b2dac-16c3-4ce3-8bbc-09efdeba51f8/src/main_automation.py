@@ -85,12 +85,6 @@ def main():
         # Execute the automation code
         try:
             # Login Test Automation
-            import time
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
             # Navigate to login page
             driver.get("https://practicetestautomation.com/practice-test-login/")
             
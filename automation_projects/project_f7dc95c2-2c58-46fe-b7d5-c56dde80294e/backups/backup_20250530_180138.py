@@ -53,7 +53,10 @@ try:
     print("Submit button clicked")
     
     # Wait for response
-    time.sleep(5)
+    try:
+        WebDriverWait(driver, 10).until(EC.url_contains("logged-in-successfully"))
+    except:
+        pass
     
     # Check for success
     try:
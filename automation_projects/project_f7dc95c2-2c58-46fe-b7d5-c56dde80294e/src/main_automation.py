@@ -7,12 +7,27 @@ Generated: 2025-05-30 18:01:38
 
 import os
 import time
+import functools
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+try:
+    from filelock import FileLock, Timeout
+except ImportError:
+    FileLock = None
 
 # WebDriver Manager imports with fallback
 try:
@@ -22,20 +37,206 @@ try:
 except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
 
+CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv("USERNAME", "")),
+]
+
+EDGE_PATHS = [
+    r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+    r"C:\Program Files\Microsoft\Edge\Application\msedge.exe",
+]
+
+def _version_key(version):
+    """Sort key for dotted version strings."""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+def _chrome_version():
+    """Read the Chrome version from the registry (Windows only)."""
+    if winreg is None:
+        return None
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+            version, _ = winreg.QueryValueEx(key, "version")
+            return version
+    except OSError:
+        return None
+
+def _installed_browser_version(browser_paths):
+    """Read the browser version from its versioned install folder (no subprocess)."""
+    for browser_path in browser_paths:
+        app_dir = Path(browser_path).parent
+        if not app_dir.is_dir():
+            continue
+        versions = [d.name for d in app_dir.iterdir() if d.is_dir() and d.name[:1].isdigit()]
+        if versions:
+            return max(versions, key=_version_key)
+    return None
+
+def _cached_driver_path(driver_name, binary_name, version, manager_factory):
+    """Reuse a driver from the webdriver-manager cache, installing only on a miss."""
+    if version:
+        driver_root = Path.home() / ".wdm" / "drivers" / driver_name
+        for candidate in driver_root.glob(f"*/{version}/**/{binary_name}*"):
+            if candidate.is_file() and candidate.suffix in ("", ".exe"):
+                return str(candidate)
+    return manager_factory(version).install()
+
+@functools.lru_cache(maxsize=None)
+def _chromedriver_path():
+    """Resolve the chromedriver path once per process."""
+    version = _chrome_version() or _installed_browser_version(CHROME_PATHS)
+    # A known version skips webdriver-manager's own subprocess-based detection
+    return _cached_driver_path(
+        "chromedriver", "chromedriver", version,
+        lambda v: ChromeDriverManager(driver_version=v)
+    )
+
+@functools.lru_cache(maxsize=None)
+def _edgedriver_path():
+    """Resolve the msedgedriver path once per process."""
+    return _cached_driver_path(
+        "edgedriver", "msedgedriver", _installed_browser_version(EDGE_PATHS),
+        lambda v: EdgeChromiumDriverManager()
+    )
+
+# Chrome is tried first on every run, so resolve its driver up front
+try:
+    _CHROME_SERVICE = ChromeService(_chromedriver_path()) if WEBDRIVER_MANAGER_AVAILABLE else None
+except Exception as e:
+    print(f"ChromeDriver resolution failed: {e}")
+    _CHROME_SERVICE = None
+
+@functools.lru_cache(maxsize=None)
+def _edge_service():
+    """Build the Edge service once, only when the Edge fallback is needed."""
+    return EdgeService(_edgedriver_path())
+
+# Third-party trackers and ad hosts the login flow never needs
+BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googletagmanager.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+]
+
+# Images and fonts can carry the login controls (icon buttons, captchas), so they are
+# only blocked when asked for, e.g. AUTOMATION_BLOCK_ASSETS=1
+BLOCK_ASSETS = os.environ.get("AUTOMATION_BLOCK_ASSETS", "").lower() in ("1", "true", "yes")
+BLOCKED_ASSET_URLS = ["*.png", "*.jpg", "*.woff2"]
+
+def block_third_party_requests(driver):
+    """Block analytics/ads (and assets when BLOCK_ASSETS is set) via CDP before navigating (Chromium drivers only)."""
+    urls = BLOCKED_URLS + BLOCKED_ASSET_URLS if BLOCK_ASSETS else BLOCKED_URLS
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    except Exception as e:
+        print(f"Request blocking unavailable: {e}")
+
+# Locators shared by the script fill and the fallback lookup
+USER_SEL = (By.CSS_SELECTOR, "#username, input[name*='user'], input[id*='user'], input[type='email']")
+PASS_SEL = (By.CSS_SELECTOR, "input[type='password']")
+SUBMIT_SEL = (By.CSS_SELECTOR, "#submit, button[type='submit'], input[type='submit']")
+FORM_SEL = (By.CSS_SELECTOR, "form")
+LOGIN_CONTROLS_SEL = (By.CSS_SELECTOR, "#username, input[type='password'], #submit")
+
+# Fills both credentials and submits in one round-trip; returns false if the form is missing
+LOGIN_SCRIPT = """
+var u = document.querySelector(arguments[2]);
+var p = document.querySelector(arguments[3]);
+var b = document.querySelector(arguments[4]);
+if (!u || !p || !b) {
+    return false;
+}
+u.value = arguments[0];
+p.value = arguments[1];
+[u, p].forEach(function (field) {
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+});
+b.scrollIntoView();
+b.click();
+return true;
+"""
+
+def retry_on_stale(max_attempts=3, backoff=0.2):
+    """Retry a DOM interaction when the page re-renders under it."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except StaleElementReferenceException:
+                    time.sleep(backoff * attempt)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@retry_on_stale(max_attempts=3, backoff=0.2)
+def _fill_and_submit(driver, user, pw):
+    """Fill the login form and click submit, re-locating everything on each attempt."""
+    if driver.execute_script(LOGIN_SCRIPT, user, pw, USER_SEL[1], PASS_SEL[1], SUBMIT_SEL[1]):
+        return
+    # Form not rendered yet: wait for it, then grab all three controls in one lookup
+    WebDriverWait(driver, 10, poll_frequency=0.1).until(
+        EC.presence_of_element_located(FORM_SEL)
+    )
+    elements = driver.find_elements(*LOGIN_CONTROLS_SEL)
+    try:
+        username_field, password_field, submit_button = elements
+    except ValueError:
+        raise Exception(f"Login form not found ({len(elements)} of 3 controls located)")
+    username_field.clear()
+    username_field.send_keys(user)
+    password_field.clear()
+    password_field.send_keys(pw)
+    submit_button.click()
+
+PROFILE_DIR = Path.home() / ".cache" / "ai_automation_profile"
+_profile_lock = None
+
+def _persistent_profile_dir():
+    """Claim the shared Chrome profile for this process, or None if another run holds it."""
+    global _profile_lock
+    if FileLock is None:
+        return None
+    if _profile_lock is None:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        # Held until the process exits; a second concurrent run falls back to a temp profile
+        lock = FileLock(f"{PROFILE_DIR}.lock")
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            return None
+        _profile_lock = lock
+    return PROFILE_DIR
+
 def setup_chrome_driver():
     """Setup Chrome driver with fallback."""
     try:
         options = ChromeOptions()
+        options.add_argument("--headless=new")
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
         options.add_argument("--window-size=1920,1080")
-        options.add_argument("--start-maximized")
+        # Skip image downloads and decoding; the login flow never needs them
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        # Return from driver.get() once the DOM is interactive
+        options.page_load_strategy = 'eager'
+        # Reuse a warm profile (HTTP cache, first-run state) across runs
+        profile_dir = _persistent_profile_dir()
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={profile_dir}")
         
-        if WEBDRIVER_MANAGER_AVAILABLE:
-            from selenium.webdriver.chrome.service import Service
-            service = Service(ChromeDriverManager().install())
-            return webdriver.Chrome(service=service, options=options)
+        if _CHROME_SERVICE is not None:
+            return webdriver.Chrome(service=_CHROME_SERVICE, options=options)
         else:
             return webdriver.Chrome(options=options)
     except Exception as e:
@@ -49,11 +250,10 @@ def setup_edge_driver():
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        options.page_load_strategy = 'eager'
         
         if WEBDRIVER_MANAGER_AVAILABLE:
-            from selenium.webdriver.edge.service import Service
-            service = Service(EdgeChromiumDriverManager().install())
-            return webdriver.Edge(service=service, options=options)
+            return webdriver.Edge(service=_edge_service(), options=options)
         else:
             return webdriver.Edge(options=options)
     except Exception as e:
@@ -79,18 +279,17 @@ def main():
         
         print("Browser started successfully")
         
+        # Explicit waits only; an implicit wait would stack under every poll below
+        driver.implicitly_wait(0)
+        wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+        block_third_party_requests(driver)
+        
         # Create screenshots directory
         os.makedirs("screenshots", exist_ok=True)
         
         # Execute the automation code
         try:
             # Login Test Automation
-            import time
-            from selenium import webdriver
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
             # Navigate to login page
             driver.get("https://practicetestautomation.com/practice-test-login/")
             
@@ -100,59 +299,16 @@ def main():
             )
             
             try:
-                # Find username field (try multiple selectors)
-                try:
-                    username_field = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.ID, "username"))
-                    )
-                except:
-                    username_field = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "input[name*='user'], input[id*='user'], input[type='email']"))
-                    )
-                
-                username_field.clear()
-                username_field.send_keys("student")
-                print("Username entered successfully")
-                
-                # Find password field
-                password_field = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
-                )
-                password_field.clear()
-                password_field.send_keys("Password123")
-                print("Password entered successfully")
-                
-                # Find and click submit button
-                try:
-                    submit_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.ID, "submit"))
-                    )
-                except:
-                    submit_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit'], input[type='submit']"))
-                    )
-                
-                # Scroll to button and click
-                driver.execute_script("arguments[0].scrollIntoView();", submit_button)
-                time.sleep(1)
-                submit_button.click()
-                print("Submit button clicked")
-                
-                # Wait for response
-                time.sleep(5)
+                # Fill username/password and click submit (retried if the form re-renders)
+                _fill_and_submit(driver, "student", "Password123")
+                print("Username and password entered, submit button clicked")
                 
-                # Check for success
+                # The site redirects to /logged-in-successfully/; URL polling needs no DOM lookups
                 try:
-                    success_element = driver.find_element(By.CSS_SELECTOR, ".post-title, h1, .success")
-                    if "success" in success_element.text.lower() or "logged in" in success_element.text.lower():
-                        print("LOGIN TEST PASSED")
-                    else:
-                        print(f"LOGIN TEST: Response received - {success_element.text}")
-                except:
-                    current_url = driver.current_url
-                    page_title = driver.title
-                    print(f"LOGIN TEST: Current URL - {current_url}")
-                    print(f"LOGIN TEST: Page Title - {page_title}")
+                    wait.until(EC.url_contains("logged-in"))
+                    print("LOGIN TEST PASSED")
+                except TimeoutException:
+                    print(f"LOGIN TEST FAILED: URL={driver.current_url}")
             
             except Exception as e:
                 print(f"LOGIN TEST FAILED: {e}")
@@ -5,89 +5,209 @@ Chrome Installation and Driver Compatibility Checker for Windows
 
 import os
 import sys
-import subprocess
+import json
+import logging
+import atexit
+import threading
+import concurrent.futures
 from pathlib import Path
+from importlib.util import find_spec
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+try:
+    from filelock import FileLock, Timeout
+except ImportError:
+    FileLock = None
+
+CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv("USERNAME", "")),
+]
+
+def _version_key(version):
+    """Sort key for dotted version strings"""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+def _chrome_version():
+    """Read the Chrome version Chrome records in the registry (Windows only)"""
+    if winreg is None:
+        return None
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+            version, _ = winreg.QueryValueEx(key, "version")
+            return version
+    except OSError:
+        return None
+
+def _installed_chrome_version():
+    """Read the Chrome version from the registry or its versioned install folder (no subprocess)"""
+    version = _chrome_version()
+    if version:
+        return version
+    for chrome_path in CHROME_PATHS:
+        app_dir = Path(chrome_path).parent
+        if not app_dir.is_dir():
+            continue
+        versions = [d.name for d in app_dir.iterdir() if d.is_dir() and d.name[:1].isdigit()]
+        if versions:
+            return max(versions, key=_version_key)
+    return None
+
+log = logging.getLogger("checker")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_handler)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+_driver_path_lock = threading.Lock()
+_driver_path = None
+
+def _chromedriver_path():
+    """Resolve chromedriver once, preferring the webdriver-manager cache over a network lookup"""
+    global _driver_path
+    if _driver_path is None:
+        # Checks run concurrently; the first caller resolves, the rest reuse its result
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = _resolve_chromedriver_path()
+    return _driver_path
+
+def _resolve_chromedriver_path():
+    """Find chromedriver in the webdriver-manager cache, installing it on a miss"""
+    version = _installed_chrome_version()
+    if version:
+        driver_root = Path.home() / ".wdm" / "drivers" / "chromedriver"
+        for candidate in driver_root.glob(f"*/{version}/**/chromedriver*"):
+            if candidate.is_file() and candidate.suffix in ("", ".exe"):
+                return str(candidate)
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    # A known version skips webdriver-manager's own subprocess-based detection
+    return ChromeDriverManager(driver_version=version).install()
 
 def check_chrome_installation():
     """Check if Chrome is installed on Windows"""
-    print("🔍 Checking Chrome installation...")
-    
-    chrome_paths = [
-        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-        r"C:\Users\{}\AppData\Local\Google\Chrome\Application\chrome.exe".format(os.getenv("USERNAME", "")),
-    ]
+    log.info("Checking Chrome installation...")
     
-    for chrome_path in chrome_paths:
+    for chrome_path in CHROME_PATHS:
         if os.path.exists(chrome_path):
-            print(f"✅ Chrome found at: {chrome_path}")
+            log.info("[OK] Chrome found at: %s", chrome_path)
+            version = _installed_chrome_version()
+            if version:
+                log.info("[OK] Chrome version: %s", version)
             return chrome_path
     
-    print("❌ Chrome not found. Please install Google Chrome.")
-    print("📥 Download from: https://www.google.com/chrome/")
+    log.error("[FAIL] Chrome not found. Please install Google Chrome.")
+    log.error("Download from: https://www.google.com/chrome/")
     return None
 
 def check_webdriver_manager():
     """Check webdriver-manager installation"""
-    print("\n🔍 Checking webdriver-manager...")
+    log.info("\nChecking webdriver-manager...")
     
     try:
         from webdriver_manager.chrome import ChromeDriverManager
-        print("✅ webdriver-manager is installed")
+        log.info("[OK] webdriver-manager is installed")
         
         # Try to get driver path
         try:
-            driver_path = ChromeDriverManager().install()
-            print(f"✅ ChromeDriver downloaded/cached at: {driver_path}")
+            driver_path = _chromedriver_path()
+            log.info("[OK] ChromeDriver downloaded/cached at: %s", driver_path)
             return True
         except Exception as e:
-            print(f"❌ ChromeDriver download failed: {e}")
+            log.error("[FAIL] ChromeDriver download failed: %s", e)
             return False
             
     except ImportError:
-        print("❌ webdriver-manager not installed")
-        print("📦 Install with: pip install webdriver-manager")
+        log.error("[FAIL] webdriver-manager not installed")
+        log.error("Install with: pip install webdriver-manager")
         return False
 
-def test_selenium():
-    """Test basic Selenium functionality"""
-    print("\n🔍 Testing Selenium...")
+PROFILE_DIR = Path.home() / ".cache" / "ai_automation_profile"
+_profile_lock = None
+
+def _persistent_profile_dir():
+    """Claim the shared Chrome profile for this process, or None if another run holds it"""
+    global _profile_lock
+    if FileLock is None:
+        return None
+    if _profile_lock is None:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        # Held until the process exits; a second concurrent run falls back to a temp profile
+        lock = FileLock(f"{PROFILE_DIR}.lock")
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            return None
+        _profile_lock = lock
+    return PROFILE_DIR
+
+_driver_singleton = None
+
+def _headless_options():
+    """Chrome options for the headless sanity checks"""
+    from selenium.webdriver.chrome.options import Options
     
-    try:
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    profile_dir = _persistent_profile_dir()
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+def _get_driver():
+    """Return the shared headless driver, starting it on first use"""
+    global _driver_singleton
+    if _driver_singleton is None:
         from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        service = Service(_chromedriver_path())
+        _driver_singleton = webdriver.Chrome(service=service, options=_headless_options())
+        atexit.register(_driver_singleton.quit)
+    return _driver_singleton
+
+def test_selenium():
+    """Test basic Selenium functionality"""
+    log.info("\nTesting Selenium...")
+    
+    try:
+        driver = _get_driver()
         
         # Test navigation
         driver.get("data:text/html,<html><body><h1>Test Page</h1></body></html>")
         title = driver.page_source
-        driver.quit()
         
-        print("✅ Selenium test successful")
+        log.info("[OK] Selenium test successful")
         return True
         
     except Exception as e:
-        print(f"❌ Selenium test failed: {e}")
-        print("\n🔧 Try these fixes:")
-        print("1. Update Chrome to latest version")
-        print("2. Run: pip install --upgrade selenium webdriver-manager")
-        print("3. Restart your terminal/IDE")
-        print("4. Try running as administrator")
+        log.error("[FAIL] Selenium test failed: %s", e)
+        log.error("\nTry these fixes:")
+        log.error("1. Update Chrome to latest version")
+        log.error("2. Run: pip install --upgrade selenium webdriver-manager")
+        log.error("3. Restart your terminal/IDE")
+        log.error("4. Try running as administrator")
         return False
 
+def _installed(package):
+    """Check a package is importable without importing it"""
+    module = package.replace('-', '_')
+    # Already-imported modules are a dict lookup; find_spec only locates the rest
+    return module in sys.modules or find_spec(module) is not None
+
 def check_dependencies():
-    """Check required Python packages"""
-    print("\n🔍 Checking Python dependencies...")
+    """Check required Python packages, returning the missing ones"""
+    log.info("\nChecking Python dependencies...")
     
     required_packages = [
         'selenium',
@@ -97,58 +217,107 @@ def check_dependencies():
         'requests'
     ]
     
-    missing_packages = []
+    missing_packages = [p for p in required_packages if not _installed(p)]
     
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-            print(f"✅ {package} is installed")
-        except ImportError:
-            print(f"❌ {package} is missing")
-            missing_packages.append(package)
+        if package in missing_packages:
+            log.error("[FAIL] %s is missing", package)
+        else:
+            log.info("[OK] %s is installed", package)
     
     if missing_packages:
-        print(f"\n📦 Install missing packages:")
-        print(f"pip install {' '.join(missing_packages)}")
-        return False
+        log.error("\nInstall missing packages:")
+        log.error("pip install %s", " ".join(missing_packages))
     
-    return True
+    return missing_packages
 
-def main():
-    """Main check function"""
-    print("🚀 Chrome and Selenium Compatibility Checker")
-    print("=" * 50)
+class _ThreadBufferedHandler(logging.Handler):
+    """Holds records from threads that registered a buffer, forwards the rest"""
     
-    all_checks_passed = True
+    def __init__(self, target):
+        super().__init__()
+        self._target = target
+        self._local = threading.local()
     
-    # Check Chrome installation
-    chrome_path = check_chrome_installation()
-    if not chrome_path:
-        all_checks_passed = False
+    def capture(self, buffer):
+        self._local.buffer = buffer
     
-    # Check dependencies
-    if not check_dependencies():
-        all_checks_passed = False
+    def emit(self, record):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            self._target.handle(record)
+        else:
+            buffer.append(record)
+
+def _run_checks(checks):
+    """Run checks concurrently and emit their log records in submission order"""
+    buffered = _ThreadBufferedHandler(_handler)
     
-    # Check webdriver-manager
-    if not check_webdriver_manager():
-        all_checks_passed = False
+    def run(check):
+        records = []
+        buffered.capture(records)
+        try:
+            return check(), records
+        finally:
+            buffered.capture(None)
     
-    # Test Selenium
-    if not test_selenium():
-        all_checks_passed = False
+    log.removeHandler(_handler)
+    log.addHandler(buffered)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = list(executor.map(run, checks))
+    finally:
+        log.removeHandler(buffered)
+        log.addHandler(_handler)
     
-    print("\n" + "=" * 50)
+    results = []
+    for result, records in outcomes:
+        for record in records:
+            _handler.handle(record)
+        results.append(result)
+    return results
+
+def main():
+    """Main check function"""
+    log.info("Chrome and Selenium Compatibility Checker")
+    log.info("=" * 50)
+    
+    # Only test_selenium is slow; the filesystem/import probes overlap with it
+    chrome_path, missing_packages, webdriver_manager_ok, selenium_ok = _run_checks([
+        check_chrome_installation,
+        check_dependencies,
+        check_webdriver_manager,
+        test_selenium,
+    ])
+    all_checks_passed = all([chrome_path, not missing_packages, webdriver_manager_ok, selenium_ok])
+    report = {
+        "chrome": chrome_path,
+        "deps_missing": missing_packages,
+        "webdriver_manager_ok": webdriver_manager_ok,
+        "selenium_ok": selenium_ok,
+        "all_checks_passed": all_checks_passed,
+    }
+    
+    log.info("\n" + "=" * 50)
     
     if all_checks_passed:
-        print("🎉 All checks passed! Your system is ready for automation.")
-        print("✅ You can now run: python main.py")
+        log.info("[OK] All checks passed! Your system is ready for automation.")
+        log.info("You can now run: python main.py")
     else:
-        print("❌ Some checks failed. Please fix the issues above.")
-        print("📚 For help, see: https://selenium-python.readthedocs.io/")
+        log.error("[FAIL] Some checks failed. Please fix the issues above.")
+        log.error("For help, see: https://selenium-python.readthedocs.io/")
+    
+    if "--json" in sys.argv:
+        sys.stdout.write(json.dumps(report) + "\n")
     
     return all_checks_passed
 
 if __name__ == "__main__":
+    if "--json" in sys.argv:
+        # Machine-readable mode: the JSON report is the only output
+        log.setLevel(logging.CRITICAL + 1)
+    elif "--quiet" in sys.argv:
+        # CI mode: only failures and fix hints
+        log.setLevel(logging.WARNING)
     success = main()
     sys.exit(0 if success else 1) 
\ No newline at end of file
@@ -2,222 +2,57 @@
 Comprehensive Automation Executor with Chat Interface
 """
 import os
+import re
 import time
+from collections import deque
+from types import MappingProxyType
+from functools import lru_cache
 from typing import Dict, Any, List
 from datetime import datetime
 
-class ComprehensiveAutomationExecutor:
-    """Comprehensive executor with chat interface and automation capabilities."""
-    
-    def __init__(self):
-        self.chat_history = []
-        self.session_data = {}
-    
-    def chat_with_automation(self, message: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """
-        Main chat interface that can handle questions and automation requests.
-        """
-        start_time = time.time()
-        
-        # Add user message to history
-        self.chat_history.append({
-            "role": "user",
-            "content": message,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        # Analyze the message intent
-        intent = self._analyze_intent(message)
-        
-        try:
-            if intent["type"] == "automation_request":
-                # Execute automation
-                automation_result = self._execute_automation_request(
-                    intent["task"], 
-                    intent.get("website_url", context.get("url", "") if context else "")
-                )
-                
-                # Create response
-                response = {
-                    "success": automation_result.get("success", False),
-                    "message": "Automation task executed successfully!" if automation_result.get("success") else "Automation task failed.",
-                    "automation_result": automation_result,
-                    "intent": intent,
-                    "execution_time": time.time() - start_time,
-                    "generated_code": automation_result.get("generated_code", ""),
-                    "approach": "automation_execution"
-                }
-                
-            elif intent["type"] == "project_request":
-                # Generate project
-                project_result = self._create_project(intent["task"])
-                
-                response = {
-                    "success": project_result.get("success", False),
-                    "message": "Project generated successfully!" if project_result.get("success") else "Project generation failed.",
-                    "project_result": project_result,
-                    "intent": intent,
-                    "execution_time": time.time() - start_time,
-                    "generated_code": project_result.get("main_script", ""),
-                    "approach": "project_generation"
-                }
-                
-            elif intent["type"] == "question":
-                # Answer question
-                answer = self._answer_question(message)
-                
-                response = {
-                    "success": True,
-                    "message": answer,
-                    "intent": intent,
-                    "execution_time": time.time() - start_time,
-                    "approach": "question_answering"
-                }
-                
-            else:
-                # General conversation
-                reply = self._generate_general_response(message)
-                
-                response = {
-                    "success": True,
-                    "message": reply,
-                    "intent": intent,
-                    "execution_time": time.time() - start_time,
-                    "approach": "general_conversation"
-                }
-            
-            # Add assistant response to history
-            self.chat_history.append({
-                "role": "assistant",
-                "content": response["message"],
-                "timestamp": datetime.now().isoformat(),
-                "metadata": response
-            })
-            
-            return response
-            
-        except Exception as e:
-            error_response = {
-                "success": False,
-                "message": f"Sorry, I encountered an error: {str(e)}",
-                "error": str(e),
-                "intent": intent,
-                "execution_time": time.time() - start_time,
-                "approach": "error_handling"
-            }
-            
-            self.chat_history.append({
-                "role": "assistant",
-                "content": error_response["message"],
-                "timestamp": datetime.now().isoformat(),
-                "metadata": error_response
-            })
-            
-            return error_response
-    
-    def _analyze_intent(self, message: str) -> Dict[str, Any]:
-        """Analyze the intent of the user message."""
-        message_lower = message.lower()
-        
-        # Automation keywords
-        automation_keywords = [
-            "automate", "test", "run", "execute", "click", "fill", "submit", 
-            "navigate", "scrape", "login", "automation", "selenium"
-        ]
-        
-        # Project generation keywords
-        project_keywords = [
-            "create project", "generate project", "build project", "new project",
-            "project structure", "scaffold", "template"
-        ]
-        
-        # Question keywords
-        question_keywords = [
-            "what", "how", "why", "when", "where", "explain", "help", "?",
-            "can you", "could you", "would you"
-        ]
-        
-        # Check for automation request
-        if any(keyword in message_lower for keyword in automation_keywords):
-            # Try to extract website URL
-            website_url = ""
-            words = message.split()
-            for i, word in enumerate(words):
-                if word.startswith("http"):
-                    website_url = word
-                    break
-                elif word in ["on", "at", "from"] and i + 1 < len(words):
-                    if words[i + 1].startswith("http"):
-                        website_url = words[i + 1]
-                        break
-            
-            return {
-                "type": "automation_request",
-                "task": message,
-                "website_url": website_url,
-                "confidence": 0.8
-            }
-        
-        # Check for project generation request
-        elif any(keyword in message_lower for keyword in project_keywords):
-            return {
-                "type": "project_request",
-                "task": message,
-                "confidence": 0.9
-            }
-        
-        # Check for question
-        elif any(keyword in message_lower for keyword in question_keywords):
-            return {
-                "type": "question",
-                "question": message,
-                "confidence": 0.7
-            }
-        
-        # Default to general conversation
-        else:
-            return {
-                "type": "conversation",
-                "message": message,
-                "confidence": 0.5
-            }
-    
-    def _execute_automation_request(self, prompt: str, website_url: str) -> Dict[str, Any]:
-        """Execute automation request and return results."""
-        try:
-            # Generate automation code based on the prompt
-            code_result = self._generate_automation_code(prompt, website_url)
-            
-            return {
-                "success": True,
-                "generated_code": code_result["code"],
-                "framework": "selenium",
-                "task": prompt,
-                "website_url": website_url,
-                "execution_time": 0.5,
-                "logs": [
-                    {
-                        "level": "info",
-                        "message": "Automation code generated successfully",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                ]
-            }
-            
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "task": prompt,
-                "website_url": website_url
-            }
-    
-    def _generate_automation_code(self, prompt: str, url: str) -> Dict[str, str]:
-        """Generate automation code based on prompt and URL."""
-        prompt_lower = prompt.lower()
-        
-        if "login" in prompt_lower and "test" in prompt_lower:
-            code = f'''from selenium import webdriver
+# One pass over the raw message yields the first URL and every intent category.
+# Keywords match at word starts so inflections ("tests", "automation") still count.
+# URLs stop before trailing sentence punctuation ("see https://x.com." -> "https://x.com").
+_INTENT_RE = re.compile(
+    r"(?P<url>https?://\S*[^\s.,;:!?'\")\]])"
+    r"|(?P<auto>\b(?:automat|test|run|execut|click|fill|submit|navigat|scrap|login|selenium))"
+    r"|(?P<proj>\b(?:create|generate|build|new)\s+project\b|\bproject\s+structure\b|\bscaffold|\btemplate)"
+    r"|(?P<q>\b(?:what|how|why|when|where|explain|help|can\s+you|could\s+you|would\s+you)\b|\?)",
+    re.IGNORECASE,
+)
+
+# Matched categories are folded into a bitmask; the priority decision
+# (automation > project > question > conversation) is a table lookup on it
+_INTENT_BITS = {"auto": 1, "proj": 2, "q": 4}
+_INTENT_BY_MASK = tuple(
+    next((group for group in ("auto", "proj", "q") if mask & _INTENT_BITS[group]), None)
+    for mask in range(8)
+)
+
+# Word-level keyword sets for the canned replies; membership is a hash lookup per token
+_TOKEN_RE = re.compile(r"[a-z]+")
+_GREETING_KW = frozenset({"hello", "hi", "hey"})
+_GREETING_PHRASES = ("good morning", "good afternoon")
+# Technical terms match as word prefixes, so plurals and compounds ("browsers", "chromedriver") count
+_BROWSER_PREFIXES = ("chrome", "browser")
+
+def _has_prefix(tokens, prefixes) -> bool:
+    """True when any token starts with one of the prefixes (a str or tuple of str)."""
+    return any(token.startswith(prefixes) for token in tokens)
+
+# Timestamps are second-resolution; reformat only when the wall-clock second changes
+_ts_cache = [0, ""]
+
+def _iso_now() -> str:
+    """Return the current local time as an ISO string, cached per second."""
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[0] = second
+        _ts_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _ts_cache[1]
+
+# Selenium script templates; {url}/{prompt} are filled with str.format_map
+_LOGIN_TPL = '''from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -282,8 +117,8 @@ def test_login():
 if __name__ == "__main__":
     test_login()
 '''
-        elif "scrape" in prompt_lower or "extract" in prompt_lower:
-            code = f'''from selenium import webdriver
+
+_SCRAPE_TPL = '''from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 import json
@@ -341,9 +176,8 @@ def scrape_website():
 if __name__ == "__main__":
     scrape_website()
 '''
-        else:
-            # Generic automation
-            code = f'''from selenium import webdriver
+
+_GENERIC_TPL = '''from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -390,7 +224,269 @@ def run_automation():
 if __name__ == "__main__":
     run_automation()
 '''
+
+_TPLS = {
+    "login_test": _LOGIN_TPL,
+    "scrape": _SCRAPE_TPL,
+    "generic": _GENERIC_TPL,
+}
+
+# Template selection: the first rule whose keywords all occur in the prompt wins
+_TPL_RULES = (
+    (frozenset({"login", "test"}), "login_test"),
+    (frozenset({"scrape"}), "scrape"),
+    (frozenset({"extract"}), "scrape"),
+)
+_TPL_KEYWORD_RE = re.compile("|".join(sorted({kw for keywords, _ in _TPL_RULES for kw in keywords})))
+
+def _select_template(prompt_lower: str) -> str:
+    """Pick a template key with a single scan of the prompt."""
+    found = set(_TPL_KEYWORD_RE.findall(prompt_lower))
+    for keywords, key in _TPL_RULES:
+        if keywords <= found:
+            return key
+    return "generic"
+
+@lru_cache(maxsize=256)
+def _render_template(key: str, url: str, prompt: str) -> str:
+    """Fill a template; only the generic one embeds the prompt, so others cache per URL."""
+    return _TPLS[key].format_map({"url": url, "prompt": prompt})
+
+@lru_cache(maxsize=256)
+def _answer_for(question_lower: str) -> str:
+    """Canned answer for a lowercased automation question; repeated questions hit the cache."""
+    tokens = set(_TOKEN_RE.findall(question_lower))
+    
+    if _has_prefix(tokens, "selenium"):
+        return "Selenium is a web automation framework that allows you to control web browsers programmatically. It's great for testing, scraping, and automating repetitive web tasks."
+    
+    elif _has_prefix(tokens, "automation"):
+        return "Web automation involves using scripts to perform tasks on websites automatically. Common use cases include testing, data extraction, form filling, and repetitive task automation."
+    
+    elif _has_prefix(tokens, "webdriver"):
+        return "WebDriver is the core component of Selenium that communicates with web browsers. It provides a programming interface to control browser actions like clicking, typing, and navigation."
+    
+    elif _has_prefix(tokens, _BROWSER_PREFIXES):
+        return "Chrome is a popular browser for automation. You'll need ChromeDriver to control it with Selenium. Make sure to use headless mode for better performance in automation scripts."
+    
+    else:
+        return "I can help you with web automation tasks using Selenium. You can ask me to automate websites, generate code, or answer questions about automation techniques."
+
+# Fixed session metadata, shared read-only across calls
+_CAPABILITIES = (
+    "website_automation",
+    "code_generation",
+    "project_creation",
+    "question_answering",
+    "chat_conversation"
+)
+_AVAILABLE_MODELS = MappingProxyType({
+    "selenium": ("chrome", "firefox", "edge"),
+    "frameworks": ("selenium", "seleniumbase")
+})
+
+# Oldest chat messages are dropped beyond this many
+_HISTORY_LIMIT = 1000
+
+class ComprehensiveAutomationExecutor:
+    """Comprehensive executor with chat interface and automation capabilities."""
+    
+    def __init__(self):
+        self._reset_history()
+        self.session_data = {}
+    
+    def _reset_history(self):
+        """Start an empty chat history."""
+        self.chat_history = deque(maxlen=_HISTORY_LIMIT)
+        # Response payloads live apart from the role/content/timestamp entries
+        self._history_metadata = deque(maxlen=_HISTORY_LIMIT)
+        self._n_user = 0
+        self._n_assistant = 0
+    
+    def _append_message(self, role: str, content: str, metadata: Dict[str, Any] = None):
+        """Append a chat message, keeping the per-role counts in step."""
+        if len(self.chat_history) == _HISTORY_LIMIT:
+            if self.chat_history[0]["role"] == "user":
+                self._n_user -= 1
+            else:
+                self._n_assistant -= 1
+        
+        self.chat_history.append({
+            "role": role,
+            "content": content,
+            "timestamp": _iso_now()
+        })
+        self._history_metadata.append(metadata)
+        
+        if role == "user":
+            self._n_user += 1
+        else:
+            self._n_assistant += 1
+    
+    def chat_with_automation(self, message: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Main chat interface that can handle questions and automation requests.
+        """
+        start_ns = time.perf_counter_ns()
+        
+        # Add user message to history
+        self._append_message("user", message)
+        
+        # Analyze the message intent (case-insensitive regex, so URLs keep their case)
+        intent = self._analyze_intent(message)
+        # Lowercased once for the reply paths below
+        message_lower = message.lower()
+        
+        try:
+            if intent["type"] == "automation_request":
+                # Execute automation
+                automation_result = self._execute_automation_request(
+                    intent["task"], 
+                    intent.get("website_url", context.get("url", "") if context else "")
+                )
+                
+                # Create response
+                response = {
+                    "success": automation_result.get("success", False),
+                    "message": "Automation task executed successfully!" if automation_result.get("success") else "Automation task failed.",
+                    "automation_result": automation_result,
+                    "intent": intent,
+                    "generated_code": automation_result.get("generated_code", ""),
+                    "approach": "automation_execution"
+                }
+                
+            elif intent["type"] == "project_request":
+                # Generate project
+                project_result = self._create_project(intent["task"])
+                
+                response = {
+                    "success": project_result.get("success", False),
+                    "message": "Project generated successfully!" if project_result.get("success") else "Project generation failed.",
+                    "project_result": project_result,
+                    "intent": intent,
+                    "generated_code": project_result.get("main_script", ""),
+                    "approach": "project_generation"
+                }
+                
+            elif intent["type"] == "question":
+                # Answer question
+                answer = self._answer_question(message, message_lower)
+                
+                response = {
+                    "success": True,
+                    "message": answer,
+                    "intent": intent,
+                    "approach": "question_answering"
+                }
+                
+            else:
+                # General conversation
+                reply = self._generate_general_response(message, message_lower)
+                
+                response = {
+                    "success": True,
+                    "message": reply,
+                    "intent": intent,
+                    "approach": "general_conversation"
+                }
+            
+            return self._finalize(response, start_ns)
+            
+        except Exception as e:
+            error_response = {
+                "success": False,
+                "message": f"Sorry, I encountered an error: {str(e)}",
+                "error": str(e),
+                "intent": intent,
+                "approach": "error_handling"
+            }
+            
+            return self._finalize(error_response, start_ns)
+    
+    def _finalize(self, response: Dict[str, Any], start_ns: int) -> Dict[str, Any]:
+        """Stamp the execution time and record the reply in the chat history."""
+        response["execution_time"] = (time.perf_counter_ns() - start_ns) / 1e9
+        self._append_message("assistant", response["message"], response)
+        return response
+    
+    def _analyze_intent(self, message: str) -> Dict[str, Any]:
+        """Analyze the intent of the user message."""
+        website_url = ""
+        mask = 0
+        for match in _INTENT_RE.finditer(message):
+            if match.lastgroup == "url":
+                website_url = website_url or match.group()
+            else:
+                mask |= _INTENT_BITS[match.lastgroup]
+        intent = _INTENT_BY_MASK[mask]
+        
+        # Check for automation request
+        if intent == "auto":
+            return {
+                "type": "automation_request",
+                "task": message,
+                "website_url": website_url,
+                "confidence": 0.8
+            }
         
+        # Check for project generation request
+        elif intent == "proj":
+            return {
+                "type": "project_request",
+                "task": message,
+                "confidence": 0.9
+            }
+        
+        # Check for question
+        elif intent == "q":
+            return {
+                "type": "question",
+                "question": message,
+                "confidence": 0.7
+            }
+        
+        # Default to general conversation
+        else:
+            return {
+                "type": "conversation",
+                "message": message,
+                "confidence": 0.5
+            }
+    
+    def _execute_automation_request(self, prompt: str, website_url: str) -> Dict[str, Any]:
+        """Execute automation request and return results."""
+        try:
+            # Generate automation code based on the prompt
+            code_result = self._generate_automation_code(prompt, website_url)
+            
+            return {
+                "success": True,
+                "generated_code": code_result["code"],
+                "framework": "selenium",
+                "task": prompt,
+                "website_url": website_url,
+                "execution_time": 0.5,
+                "logs": [
+                    {
+                        "level": "info",
+                        "message": "Automation code generated successfully",
+                        "timestamp": _iso_now()
+                    }
+                ]
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "task": prompt,
+                "website_url": website_url
+            }
+    
+    def _generate_automation_code(self, prompt: str, url: str) -> Dict[str, str]:
+        """Generate automation code based on prompt and URL."""
+        key = _select_template(prompt.lower())
+        code = _render_template(key, url, prompt if key == "generic" else "")
         return {"code": code, "framework": "selenium"}
     
     def _create_project(self, prompt: str) -> Dict[str, Any]:
@@ -415,33 +511,20 @@ if __name__ == "__main__":
                 "error": str(e)
             }
     
-    def _answer_question(self, question: str) -> str:
+    def _answer_question(self, question: str, question_lower: str = None) -> str:
         """Answer automation-related questions."""
-        question_lower = question.lower()
-        
-        if "selenium" in question_lower:
-            return "Selenium is a web automation framework that allows you to control web browsers programmatically. It's great for testing, scraping, and automating repetitive web tasks."
-        
-        elif "automation" in question_lower:
-            return "Web automation involves using scripts to perform tasks on websites automatically. Common use cases include testing, data extraction, form filling, and repetitive task automation."
-        
-        elif "webdriver" in question_lower:
-            return "WebDriver is the core component of Selenium that communicates with web browsers. It provides a programming interface to control browser actions like clicking, typing, and navigation."
-        
-        elif "chrome" in question_lower or "browser" in question_lower:
-            return "Chrome is a popular browser for automation. You'll need ChromeDriver to control it with Selenium. Make sure to use headless mode for better performance in automation scripts."
-        
-        else:
-            return "I can help you with web automation tasks using Selenium. You can ask me to automate websites, generate code, or answer questions about automation techniques."
+        return _answer_for(question_lower if question_lower is not None else question.lower())
     
-    def _generate_general_response(self, message: str) -> str:
+    def _generate_general_response(self, message: str, message_lower: str = None) -> str:
         """Generate a general conversational response."""
-        greetings = ["hello", "hi", "hey", "good morning", "good afternoon"]
+        if message_lower is None:
+            message_lower = message.lower()
+        tokens = set(_TOKEN_RE.findall(message_lower))
         
-        if any(greeting in message.lower() for greeting in greetings):
+        if _GREETING_KW & tokens or any(phrase in message_lower for phrase in _GREETING_PHRASES):
             return "Hello! I'm your automation assistant. I can help you automate websites, generate Selenium code, and answer questions about web automation. What would you like to automate today?"
         
-        elif "help" in message.lower():
+        elif "help" in tokens:
             return "I can help you with:\n• Website automation and testing\n• Generating Selenium code\n• Creating automation projects\n• Answering automation questions\n\nJust tell me what you'd like to automate or ask me a question!"
         
         else:
@@ -449,34 +532,28 @@ if __name__ == "__main__":
     
     def get_chat_history(self) -> List[Dict[str, Any]]:
         """Get the chat history."""
-        return self.chat_history
+        return [
+            entry if metadata is None else {**entry, "metadata": metadata}
+            for entry, metadata in zip(self.chat_history, self._history_metadata)
+        ]
     
     def clear_chat_history(self):
         """Clear the chat history."""
-        self.chat_history = []
+        self._reset_history()
     
     def get_session_status(self) -> Dict[str, Any]:
         """Get current session status."""
         return {
             "chat_messages": len(self.chat_history),
-            "user_messages": len([msg for msg in self.chat_history if msg["role"] == "user"]),
-            "assistant_messages": len([msg for msg in self.chat_history if msg["role"] == "assistant"]),
+            "user_messages": self._n_user,
+            "assistant_messages": self._n_assistant,
             "session_active": True,
-            "capabilities": [
-                "website_automation",
-                "code_generation", 
-                "project_creation",
-                "question_answering",
-                "chat_conversation"
-            ]
+            "capabilities": _CAPABILITIES
         }
     
     def get_available_models(self) -> Dict[str, List[str]]:
         """Get available models (simplified for this executor)."""
-        return {
-            "selenium": ["chrome", "firefox", "edge"],
-            "frameworks": ["selenium", "seleniumbase"]
-        }
+        return _AVAILABLE_MODELS
     
     def switch_model(self, provider: str, model_name: str) -> bool:
         """Switch model (placeholder for this executor)."""
@@ -484,7 +561,7 @@ if __name__ == "__main__":
     
     def cleanup(self):
         """Clean up resources."""
-        self.chat_history = []
+        self._reset_history()
         self.session_data = {}
 
 # Global instance for easy access
@@ -2,43 +2,258 @@
 Dynamic AI Executor - Simple Implementation
 """
 
+import re
 import time
+import queue
 import traceback
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
-from selenium_executor import SeleniumExecutor
-from edge_executor import EdgeExecutor
+
+# Timestamps are second-resolution; reformat only when the wall-clock second changes
+_ts_cache = [0, ""]
+
+def _iso_now() -> str:
+    """Return the current local time as an ISO string, cached per second."""
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[0] = second
+        _ts_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _ts_cache[1]
+
+# Generated-code templates; {url} is filled with str.format_map. Each defines
+# run(driver) and never creates a driver itself, so any browser can execute it
+_CLICK_TPL = '''
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+def run(driver):
+    # Navigate to website
+    driver.get("{url}")
+    time.sleep(3)
+
+    # Find and click button
+    try:
+        # Try different button selectors
+        button = None
+        for selector in ["button", "input[type='submit']", "input[type='button']", "a.btn", ".button"]:
+            try:
+                button = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                )
+                break
+            except:
+                continue
+    
+        if button:
+            button.click()
+            print("Button clicked successfully")
+            time.sleep(2)
+        else:
+            print("No clickable button found")
+        
+    except Exception as e:
+        print(f"Error clicking button: {{e}}")
+'''
+
+_FILL_TPL = '''
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+def run(driver):
+    # Navigate to website
+    driver.get("{url}")
+    time.sleep(3)
+
+    # Find and fill form fields
+    try:
+        # Find input fields
+        inputs = driver.find_elements(By.TAG_NAME, "input")
+    
+        for i, input_field in enumerate(inputs):
+            if input_field.get_attribute("type") in ["text", "email", "password"]:
+                input_field.clear()
+                input_field.send_keys(f"test_value_{{i}}")
+                print(f"Filled input field {{i}}")
+    
+        # Look for submit button
+        submit_button = None
+        for selector in ["input[type='submit']", "button[type='submit']", "button"]:
+            try:
+                submit_button = driver.find_element(By.CSS_SELECTOR, selector)
+                break
+            except:
+                continue
+    
+        if submit_button:
+            submit_button.click()
+            print("Form submitted")
+            time.sleep(2)
+        
+    except Exception as e:
+        print(f"Error filling form: {{e}}")
+'''
+
+_DEFAULT_TPL = '''
+import time
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+def run(driver):
+    # Navigate to website
+    driver.get("{url}")
+    time.sleep(3)
+
+    # Take screenshot
+    driver.save_screenshot("automation_result.png")
+
+    # Get page title and basic info
+    title = driver.title
+    print(f"Page title: {{title}}")
+
+    # Count page elements
+    links = len(driver.find_elements(By.TAG_NAME, "a"))
+    buttons = len(driver.find_elements(By.TAG_NAME, "button"))
+    inputs = len(driver.find_elements(By.TAG_NAME, "input"))
+
+    print(f"Found {{links}} links, {{buttons}} buttons, {{inputs}} inputs")
+'''
+
+_TPLS = {
+    "click": _CLICK_TPL,
+    "fill": _FILL_TPL,
+    "default": _DEFAULT_TPL,
+}
+
+# The same templates compiled once at import; the URL is bound through the URL global
+_TPL_CODE = {
+    key: compile(template.replace('"{url}"', "URL").format_map({}), f"<{key}_template>", "exec")
+    for key, template in _TPLS.items()
+}
+
+# Template selection: the first rule whose keywords all occur in the prompt wins
+_TPL_RULES = (
+    (frozenset({"click", "button"}), "click"),
+    (frozenset({"fill"}), "fill"),
+    (frozenset({"form"}), "fill"),
+)
+_TPL_KEYWORD_RE = re.compile("|".join(sorted({kw for keywords, _ in _TPL_RULES for kw in keywords})))
+
+def _select_template(prompt_lower: str) -> str:
+    """Pick a template key with a single scan of the prompt."""
+    found = set(_TPL_KEYWORD_RE.findall(prompt_lower))
+    for keywords, key in _TPL_RULES:
+        if keywords <= found:
+            return key
+    return "default"
+
+@lru_cache(maxsize=256)
+def _render_template(key: str, url: str) -> str:
+    """Fill a template for a URL; repeated (template, URL) pairs hit the cache."""
+    return _TPLS[key].format_map({"url": url})
+
+@lru_cache(maxsize=None)
+def _shared_chrome_options():
+    """Chrome options shared by every pooled driver in this process."""
+    from selenium.webdriver.chrome.options import Options
+    
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    return options
+
+@lru_cache(maxsize=None)
+def _chromedriver_path():
+    """ChromeDriver path resolved once per process, or None to let Selenium Manager locate it."""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    except ImportError:
+        return None
+
+# Same directory and naming as SeleniumExecutor, without constructing one for Edge runs
+SCREENSHOTS_DIR = Path("screenshots")
+
+def _save_screenshot(driver, name: str):
+    """Save a screenshot with the given driver; returns the path, or None on failure."""
+    try:
+        SCREENSHOTS_DIR.mkdir(exist_ok=True)
+        filepath = SCREENSHOTS_DIR / f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        driver.save_screenshot(str(filepath))
+        return str(filepath)
+    except Exception as e:
+        print(f"Failed to take screenshot: {e}")
+        return None
 
 class DynamicAIExecutor:
     """Simple dynamic automation executor."""
     
     def __init__(self):
-        self.selenium_executor = SeleniumExecutor()
-        self.edge_executor = EdgeExecutor()
+        # Executors (and Selenium with them) are imported on first use
+        self._selenium = None
+        self._edge = None
+        # In preference order
+        self._driver_factories = {
+            "chrome": self._create_chrome_driver,
+            "edge": lambda: self.edge_executor.create_driver(),
+        }
+        # Warm drivers per browser, reused across executions (most recently used first)
+        self._driver_pools = {browser: queue.LifoQueue() for browser in self._driver_factories}
+        # Browser picked by the first-use probe
+        self._preferred = None
         
+    @property
+    def selenium_executor(self):
+        """Chrome executor, created on first access."""
+        if self._selenium is None:
+            from selenium_executor import SeleniumExecutor
+            self._selenium = SeleniumExecutor()
+        return self._selenium
+    
+    @property
+    def edge_executor(self):
+        """Edge executor, created on first access."""
+        if self._edge is None:
+            from edge_executor import EdgeExecutor
+            self._edge = EdgeExecutor()
+        return self._edge
+    
     def execute_automation(self, prompt: str, website_url: str, framework: str = "selenium", timeout: int = 180) -> Dict[str, Any]:
         """Execute automation based on prompt."""
         start_time = time.time()
         
         try:
-            # Generate simple automation code based on prompt
-            code = self._generate_simple_code(prompt, website_url)
+            # Simple keyword-based code generation; "default" navigates and takes a screenshot.
+            # The rendered source is reported back, the precompiled template is what runs.
+            key = _select_template(prompt.lower())
+            code = _render_template(key, website_url)
             
-            # Try Chrome first, then Edge
+            # Dispatch straight to the browser found by the one-time probe; a failing
+            # script is reported as-is rather than retried on another browser
+            browser = self._probe_browser()
+            driver = self._acquire_driver(browser)
+            if driver is None:
+                raise Exception(f"Could not start {browser} driver")
             try:
-                result = self.selenium_executor.execute_code(code, website_url, timeout)
-                result["browser_used"] = "chrome"
-            except Exception as e:
-                print(f"Chrome failed, trying Edge: {e}")
-                # Adapt code for Edge
-                edge_code = code.replace("webdriver.Chrome", "webdriver.Edge")
-                result = self.edge_executor.execute_code(edge_code, website_url, timeout)
-                result["browser_used"] = "edge"
+                result = self._run_code(driver, _TPL_CODE[key], website_url)
+            finally:
+                self._release_driver(browser, driver)
+            result["browser_used"] = browser
             
             result.update({
                 "framework": framework,
                 "generated_code": code,
-                "context_chain": [{"prompt": prompt, "timestamp": datetime.now().isoformat()}],
+                "context_chain": [{"prompt": prompt, "timestamp": _iso_now()}],
                 "function_calls": [],
                 "automation_flow": {"steps": ["navigate", "execute", "capture"]}
             })
@@ -52,7 +267,7 @@ class DynamicAIExecutor:
                 "logs": [{
                     "level": "error",
                     "message": f"Dynamic execution failed: {str(e)}",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _iso_now()
                 }],
                 "screenshots": [],
                 "execution_time": time.time() - start_time,
@@ -63,114 +278,130 @@ class DynamicAIExecutor:
                 "automation_flow": None
             }
     
-    def _generate_simple_code(self, prompt: str, url: str) -> str:
-        """Generate simple automation code based on prompt."""
-        prompt_lower = prompt.lower()
+    def _create_chrome_driver(self):
+        """Start Chrome with the shared options, falling back to the full setup."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
         
-        # Simple keyword-based code generation
-        if "click" in prompt_lower and "button" in prompt_lower:
-            return f'''
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-# Navigate to website
-driver.get("{url}")
-time.sleep(3)
-
-# Find and click button
-try:
-    # Try different button selectors
-    button = None
-    for selector in ["button", "input[type='submit']", "input[type='button']", "a.btn", ".button"]:
         try:
-            button = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-            )
-            break
-        except:
-            continue
-    
-    if button:
-        button.click()
-        print("Button clicked successfully")
-        time.sleep(2)
-    else:
-        print("No clickable button found")
-        
-except Exception as e:
-    print(f"Error clicking button: {{e}}")
-'''
-        
-        elif "fill" in prompt_lower or "form" in prompt_lower:
-            return f'''
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-# Navigate to website
-driver.get("{url}")
-time.sleep(3)
-
-# Find and fill form fields
-try:
-    # Find input fields
-    inputs = driver.find_elements(By.TAG_NAME, "input")
+            # Each driver needs its own Service: it owns the chromedriver process and port
+            path = _chromedriver_path()
+            service = Service(path) if path else Service()
+            return webdriver.Chrome(service=service, options=_shared_chrome_options())
+        except Exception as e:
+            print(f"Shared Chrome setup failed, using full driver setup: {e}")
+            return self.selenium_executor.create_chrome_driver()
+    
+    def _start_driver(self, browser: str):
+        """Start a new driver for the browser, or None if it can't be started."""
+        try:
+            return self._driver_factories[browser]()
+        except Exception as e:
+            print(f"{browser} driver creation failed: {e}")
+            return None
     
-    for i, input_field in enumerate(inputs):
-        if input_field.get_attribute("type") in ["text", "email", "password"]:
-            input_field.clear()
-            input_field.send_keys(f"test_value_{{i}}")
-            print(f"Filled input field {{i}}")
+    def _probe_browser(self) -> str:
+        """Find the first browser whose driver starts; done once per executor."""
+        if self._preferred is None:
+            for browser in self._driver_factories:
+                driver = self._start_driver(browser)
+                if driver is not None:
+                    # The probe driver becomes the first pooled one
+                    self._driver_pools[browser].put(driver)
+                    self._preferred = browser
+                    break
+            else:
+                raise Exception("Could not start Chrome or Edge")
+        return self._preferred
     
-    # Look for submit button
-    submit_button = None
-    for selector in ["input[type='submit']", "button[type='submit']", "button"]:
+    def _acquire_driver(self, browser: str):
+        """Take a warm driver from the browser's pool, or start a new one."""
         try:
-            submit_button = driver.find_element(By.CSS_SELECTOR, selector)
-            break
-        except:
-            continue
-    
-    if submit_button:
-        submit_button.click()
-        print("Form submitted")
-        time.sleep(2)
+            return self._driver_pools[browser].get_nowait()
+        except queue.Empty:
+            return self._start_driver(browser)
+    
+    def _release_driver(self, browser: str, driver):
+        """Reset a driver's session state and return it to its pool."""
+        try:
+            # delete_all_cookies only covers the current origin; CDP clears every site's cookies and storage
+            driver.delete_all_cookies()
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+            driver.get("about:blank")
+        except Exception:
+            # The session is broken; don't hand it out again
+            self._quit_driver(driver)
+            return
+        self._driver_pools[browser].put(driver)
+    
+    def _quit_driver(self, driver):
+        """Quit a driver, ignoring errors from an already dead session."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def _run_code(self, driver, code, website_url: str) -> Dict[str, Any]:
+        """Execute a compiled template against an already running driver."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
         
-except Exception as e:
-    print(f"Error filling form: {{e}}")
-'''
+        start_time = time.time()
+        logs = []
+        screenshots = []
         
-        else:
-            # Default: navigate and take screenshot
-            return f'''
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-
-# Navigate to website
-driver.get("{url}")
-time.sleep(3)
-
-# Take screenshot
-driver.save_screenshot("automation_result.png")
-
-# Get page title and basic info
-title = driver.title
-print(f"Page title: {{title}}")
-
-# Count page elements
-links = len(driver.find_elements(By.TAG_NAME, "a"))
-buttons = len(driver.find_elements(By.TAG_NAME, "button"))
-inputs = len(driver.find_elements(By.TAG_NAME, "input"))
-
-print(f"Found {{links}} links, {{buttons}} buttons, {{inputs}} inputs")
-'''
+        try:
+            exec_globals = {
+                "driver": driver,
+                "By": By,
+                "WebDriverWait": WebDriverWait,
+                "EC": EC,
+                "time": time,
+                "website_url": website_url,
+                "URL": website_url,
+                "print": lambda *args: logs.append({
+                    "level": "info",
+                    "message": " ".join(str(arg) for arg in args),
+                    "timestamp": _iso_now()
+                })
+            }
+            exec(code, exec_globals)
+            exec_globals["run"](driver)
+            
+            screenshot_path = _save_screenshot(driver, "execution_result")
+            if screenshot_path:
+                screenshots.append(screenshot_path)
+            
+            return {
+                "success": True,
+                "logs": logs,
+                "screenshots": screenshots,
+                "execution_time": time.time() - start_time
+            }
+            
+        except Exception as e:
+            logs.append({
+                "level": "error",
+                "message": str(e),
+                "timestamp": _iso_now()
+            })
+            
+            return {
+                "success": False,
+                "error": str(e),
+                "logs": logs,
+                "screenshots": screenshots,
+                "execution_time": time.time() - start_time
+            }
     
     def cleanup(self):
         """Cleanup resources."""
-        pass 
\ No newline at end of file
+        for pool in self._driver_pools.values():
+            while True:
+                try:
+                    driver = pool.get_nowait()
+                except queue.Empty:
+                    break
+                self._quit_driver(driver) 
\ No newline at end of file
@@ -7,6 +7,12 @@ import os
 import re
 import time
 import json
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, Optional, List, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -14,26 +20,228 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
 
 from selenium_executor import SeleniumExecutor
 
+logger = logging.getLogger(__name__)
+
+# Action patterns as (group name, pattern, action type), scanned in one pass
+_ACTION_PATTERNS = [
+    ("click", r"click (?:on )?(.+?)(?:\s|$)", "click"),
+    ("type", r"type (?:in )?(.+?) (?:in|into) (.+?)(?:\s|$)", "type"),
+    ("fill", r"fill (?:in )?(.+?) (?:with|as) (.+?)(?:\s|$)", "type"),
+    ("search", r"search for (.+?)(?:\s|$)", "search"),
+    ("navigate", r"navigate to (.+?)(?:\s|$)", "navigate"),
+    ("go_to", r"go to (.+?)(?:\s|$)", "navigate"),
+    ("find", r"find (.+?)(?:\s|$)", "find"),
+    ("select", r"select (.+?)(?:\s|$)", "select"),
+    ("submit", r"submit (?:the )?(.+?)(?:\s|$)", "submit")
+]
+_MASTER_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _ACTION_PATTERNS))
+
+# Group name -> (action type, index of its first capture group in _MASTER_RE)
+_ACTION_GROUPS = {
+    name: (action_type, _MASTER_RE.groupindex[name] + 1)
+    for name, _, action_type in _ACTION_PATTERNS
+}
+
+@lru_cache(maxsize=None)
+def _locator_kind(strategy_type: str) -> str:
+    """Classify a strategy type as 'text', 'xpath' or 'css' ('' if unknown), once per type"""
+    for prefix, kind in (("js_text", "text"), ("xpath", "xpath"), ("css", "css")):
+        if strategy_type.startswith(prefix):
+            return kind
+    return ""
+
+# Common search field selectors, in preference order
+_SEARCH_STRATEGIES = tuple({"type": "css_search", "selector": selector} for selector in [
+    "input[type='search']",
+    "input[name*='search']",
+    "input[placeholder*='search' i]",
+    "input[id*='search']",
+    ".search-input",
+    "#search",
+    "[role='searchbox']"
+])
+
+# Target text -> id/class fragment
+_TARGET_TABLE = str.maketrans(" -", "__")
+
+# Task components: (name, single-word keywords, multi-word phrases as token sets)
+_WORD_RE = re.compile(r"\w+")
+_COMPONENT_KEYWORDS = (
+    ("login_detected", frozenset({"login", "authenticate"}), (frozenset({"sign", "in"}),)),
+    ("form_detected", frozenset({"form", "submit", "fill"}), ()),
+    ("search_detected", frozenset({"search", "find"}), (frozenset({"look", "for"}),)),
+    ("click_detected", frozenset({"click", "press", "tap"}), ()),
+    ("navigate_detected", frozenset({"navigate", "open"}), (frozenset({"go", "to"}),)),
+    ("data_extraction", frozenset({"extract", "get", "scrape", "collect"}), ()),
+)
+
+@lru_cache(maxsize=512)
+def _classify_task(task_lower: str) -> int:
+    """Bit i is set when component i of _COMPONENT_KEYWORDS occurs in the task"""
+    words = set(_WORD_RE.findall(task_lower))
+    flags = 0
+    for bit, (_, keywords, phrases) in enumerate(_COMPONENT_KEYWORDS):
+        if not keywords.isdisjoint(words) or any(phrase <= words for phrase in phrases):
+            flags |= 1 << bit
+    return flags
+
+# Case-insensitive text lookup; the text is already lowercased. Walks text nodes
+# natively instead of running XPath translate() over every node
+_FIND_TEXT_FN = """function (text) {
+    var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT), node;
+    while ((node = walker.nextNode())) {
+        if (node.nodeValue.toLowerCase().indexOf(text) !== -1) return node.parentElement;
+    }
+    return null;
+}"""
+_FIND_TEXT_SCRIPT = "return (" + _FIND_TEXT_FN + ")(arguments[0]);"
+
+# Evaluates every strategy in one round trip, returning [index, element] for each hit in priority order
+_LOCATE_SCRIPT = """
+var findText = """ + _FIND_TEXT_FN + """;
+var found = [];
+arguments[0].forEach(function (strategy, i) {
+    var el = null;
+    try {
+        if (strategy[0] === 'text') {
+            el = findText(strategy[1]);
+        } else if (strategy[0] === 'xpath') {
+            el = document.evaluate(strategy[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } else {
+            el = document.querySelector(strategy[1]);
+        }
+    } catch (e) {
+        // Invalid selector (e.g. jQuery-only :contains); skip it
+    }
+    if (el) found.push([i, el]);
+});
+return found;
+"""
+
+# Scrolls an element to the centre and clicks it; false when it has no box to click
+_SCROLL_CLICK_SCRIPT = """
+var e = arguments[0];
+e.scrollIntoView({block: 'center'});
+if (e.getBoundingClientRect().width === 0) return false;
+e.click();
+return true;
+"""
+
+# Resolves once the DOM has been quiet for arguments[0] ms, or after arguments[1] ms at most
+_DOM_QUIET_SCRIPT = """
+var quietMs = arguments[0], limitMs = arguments[1], done = arguments[arguments.length - 1];
+var quietTimer, limitTimer, observer;
+function finish() {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(limitTimer);
+    done();
+}
+observer = new MutationObserver(function () {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(finish, quietMs);
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+quietTimer = setTimeout(finish, quietMs);
+limitTimer = setTimeout(finish, limitMs);
+"""
+
+# Everything find_element reports about an element, read in one round trip
+_ELEMENT_INFO_SCRIPT = """
+var e = arguments[0], r = e.getBoundingClientRect(), attrs = {};
+['id', 'class', 'name', 'type', 'value', 'href'].forEach(function (name) {
+    var v = name === 'class' ? e.getAttribute('class') : (e[name] != null ? e[name] : e.getAttribute(name));
+    if (v) attrs[name] = String(v);
+});
+return {
+    tag_name: e.tagName.toLowerCase(),
+    text: (e.innerText || '').slice(0, 100),
+    attributes: attrs,
+    location: {x: Math.round(r.left + window.pageXOffset), y: Math.round(r.top + window.pageYOffset)},
+    size: {width: Math.round(r.width), height: Math.round(r.height)}
+};
+"""
+
+def _write_png(filepath: str, png: bytes):
+    """Write captured screenshot bytes to disk"""
+    with open(filepath, "wb") as f:
+        f.write(png)
+
+class _DriverSession(threading.local):
+    """The calling thread's driver and the lookups cached against it"""
+    
+    def __init__(self):
+        self.driver = None
+        # Located elements keyed by (page URL, strategy type, selector)
+        self.element_cache = {}
+        # (page URL, strategy type, selector) lookups that already timed out
+        self.negative_cache = set()
+        # WebDriverWait per timeout for the driver
+        self.waits = {}
+        self.pending_screenshots = []
+
 class DynamicAutomationExecutor:
     """Advanced automation executor with AI-driven capabilities"""
     
     def __init__(self):
         self.selenium_executor = SeleniumExecutor()
-        self.current_driver = None
         self.automation_history = []
-        self.element_cache = {}
+        # Each thread drives its own browser, so concurrent automations don't share state
+        self._session = _DriverSession()
+        # Warm drivers reused across execute_automation calls (most recently used first)
+        self._driver_pool = queue.LifoQueue()
+        # Screenshots are captured on the caller thread and written to disk here
+        self._screenshot_pool = ThreadPoolExecutor(max_workers=1)
+        self._screenshots_dir = os.path.join(os.getcwd(), "screenshots")
+        os.makedirs(self._screenshots_dir, exist_ok=True)
+    
+    @property
+    def current_driver(self):
+        return self._session.driver
+    
+    @current_driver.setter
+    def current_driver(self, driver):
+        # Cached elements and waits belong to the previous driver
+        session = self._session
+        session.driver = driver
+        session.element_cache.clear()
+        session.negative_cache.clear()
+        session.waits.clear()
+    
+    @property
+    def element_cache(self) -> Dict[Tuple[str, str, str], Any]:
+        return self._session.element_cache
+    
+    @property
+    def _negative_cache(self) -> set:
+        return self._session.negative_cache
+    
+    @property
+    def _waits(self) -> Dict[float, WebDriverWait]:
+        return self._session.waits
+    
+    @property
+    def _pending_screenshots(self) -> list:
+        return self._session.pending_screenshots
         
     def create_driver(self, headless: bool = True) -> Dict[str, Any]:
         """Create a new WebDriver instance"""
         try:
-            result = self.selenium_executor.create_driver(headless=headless)
-            if result.get("success"):
-                self.current_driver = result.get("driver")
-            return result
+            driver = self.selenium_executor.create_chrome_driver(headless=headless)
+            if driver is None:
+                return {
+                    "success": False,
+                    "error": "Failed to create driver"
+                }
+            self.current_driver = driver
+            return {
+                "success": True,
+                "driver": driver
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -42,16 +250,19 @@ class DynamicAutomationExecutor:
     
     def execute_automation(self, url: str, task_description: str, framework: str = "selenium") -> Dict[str, Any]:
         """Execute dynamic automation based on task description"""
+        # An explicitly created driver is used as-is; otherwise borrow one from the pool
+        pooled = self.current_driver is None
         try:
-            # Create driver if needed
-            if not self.current_driver:
-                driver_result = self.create_driver()
+            if pooled:
+                driver_result = self._acquire_driver()
                 if not driver_result.get("success"):
                     return driver_result
             
             # Navigate to URL
             self.current_driver.get(url)
-            time.sleep(2)
+            self.element_cache.clear()
+            self._negative_cache.clear()
+            self._wait_ready()
             
             # Analyze task and execute steps
             execution_plan = self.analyze_task(task_description, url)
@@ -75,6 +286,62 @@ class DynamicAutomationExecutor:
                 "url": url,
                 "framework": framework
             }
+        finally:
+            if pooled and self.current_driver is not None:
+                self._release_driver()
+    
+    def _acquire_driver(self) -> Dict[str, Any]:
+        """Make a warm pooled driver current, creating one when the pool is empty"""
+        try:
+            self.current_driver = self._driver_pool.get_nowait()
+            return {"success": True, "driver": self.current_driver}
+        except queue.Empty:
+            return self.create_driver()
+    
+    def _release_driver(self):
+        """Reset the current driver's session state and return it to the pool"""
+        self._flush_screenshots()
+        driver = self.current_driver
+        self.current_driver = None
+        try:
+            # delete_all_cookies only covers the current origin; CDP clears every site's cookies and storage
+            driver.delete_all_cookies()
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+            driver.get("about:blank")
+        except Exception:
+            # The session is broken; don't hand it out again
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        self._driver_pool.put(driver)
+    
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Return the current driver's WebDriverWait for a timeout, created once"""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.current_driver, timeout)
+        return wait
+    
+    def _wait_ready(self, timeout: int = 2):
+        """Wait until the page has finished loading, up to timeout seconds"""
+        try:
+            self._wait(timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            # Slow page; carry on as the fixed sleep used to
+            pass
+    
+    def _wait_dom_quiet(self, timeout: float = 1.0, quiet_ms: int = 150):
+        """Wait until the DOM has had no mutations for quiet_ms, up to timeout seconds"""
+        try:
+            self.current_driver.execute_async_script(_DOM_QUIET_SCRIPT, quiet_ms, int(timeout * 1000))
+        except WebDriverException:
+            # The page navigated away mid-wait; the next lookup waits for it anyway
+            pass
     
     def analyze_task(self, task_description: str, url: str) -> Dict[str, Any]:
         """Analyze task description and create execution plan"""
@@ -103,57 +370,48 @@ class DynamicAutomationExecutor:
     
     def extract_task_components(self, task_description: str) -> Dict[str, Any]:
         """Extract components from task description"""
+        flags = _classify_task(task_description.lower())
+        
         components = {
-            "login_detected": any(word in task_description.lower() for word in ["login", "sign in", "authenticate"]),
-            "form_detected": any(word in task_description.lower() for word in ["form", "submit", "fill"]),
-            "search_detected": any(word in task_description.lower() for word in ["search", "find", "look for"]),
-            "click_detected": any(word in task_description.lower() for word in ["click", "press", "tap"]),
-            "navigate_detected": any(word in task_description.lower() for word in ["go to", "navigate", "open"]),
-            "data_extraction": any(word in task_description.lower() for word in ["extract", "get", "scrape", "collect"])
+            name: bool(flags >> bit & 1)
+            for bit, (name, _, _) in enumerate(_COMPONENT_KEYWORDS)
         }
         return components
     
-    def extract_actions(self, task_description: str) -> List[Dict[str, Any]]:
+    def extract_actions(self, task_description: str, max_actions: int = 32) -> List[Dict[str, Any]]:
         """Extract specific actions from task description"""
         actions = []
         
-        # Common patterns for action extraction
-        patterns = [
-            (r"click (?:on )?(.+?)(?:\s|$)", "click"),
-            (r"type (?:in )?(.+?) (?:in|into) (.+?)(?:\s|$)", "type"),
-            (r"fill (?:in )?(.+?) (?:with|as) (.+?)(?:\s|$)", "type"),
-            (r"search for (.+?)(?:\s|$)", "search"),
-            (r"navigate to (.+?)(?:\s|$)", "navigate"),
-            (r"go to (.+?)(?:\s|$)", "navigate"),
-            (r"find (.+?)(?:\s|$)", "find"),
-            (r"select (.+?)(?:\s|$)", "select"),
-            (r"submit (?:the )?(.+?)(?:\s|$)", "submit")
-        ]
-        
         task_lower = task_description.lower()
         
-        for pattern, action_type in patterns:
-            matches = re.finditer(pattern, task_lower)
-            for match in matches:
-                if action_type == "type" and len(match.groups()) >= 2:
-                    actions.append({
-                        "type": "type",
-                        "target": match.group(2).strip(),
-                        "value": match.group(1).strip(),
-                        "description": f"Type '{match.group(1).strip()}' into {match.group(2).strip()}"
-                    })
-                elif action_type == "navigate":
-                    actions.append({
-                        "type": "navigate",
-                        "target": match.group(1).strip(),
-                        "description": f"Navigate to {match.group(1).strip()}"
-                    })
-                else:
-                    actions.append({
-                        "type": action_type,
-                        "target": match.group(1).strip(),
-                        "description": f"{action_type.title()} {match.group(1).strip()}"
-                    })
+        matches = _MASTER_RE.finditer(task_lower)
+        for match in islice(matches, max_actions):
+            action_type, first = _ACTION_GROUPS[match.lastgroup]
+            if action_type == "type":
+                value, target = match.group(first).strip(), match.group(first + 1).strip()
+                actions.append({
+                    "type": "type",
+                    "target": target,
+                    "value": value,
+                    "description": f"Type '{value}' into {target}"
+                })
+            elif action_type == "navigate":
+                target = match.group(first).strip()
+                actions.append({
+                    "type": "navigate",
+                    "target": target,
+                    "description": f"Navigate to {target}"
+                })
+            else:
+                target = match.group(first).strip()
+                actions.append({
+                    "type": action_type,
+                    "target": target,
+                    "description": f"{action_type.title()} {target}"
+                })
+        
+        if next(matches, None) is not None:
+            logger.warning("Task has more than %d actions; ignoring the rest", max_actions)
         
         # If no specific actions found, create a general action
         if not actions:
@@ -165,8 +423,10 @@ class DynamicAutomationExecutor:
         
         return actions
     
-    def generate_selector_strategies(self, target: str) -> List[Dict[str, str]]:
-        """Generate multiple selector strategies for a target element"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def generate_selector_strategies(target: str) -> Tuple[Dict[str, str], ...]:
+        """Generate multiple selector strategies for a target element (cached per target; don't mutate)"""
         strategies = []
         target_lower = target.lower()
         
@@ -178,8 +438,8 @@ class DynamicAutomationExecutor:
         })
         
         strategies.append({
-            "type": "xpath_text_partial",
-            "selector": f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{target_lower}')]",
+            "type": "js_text_ci",
+            "selector": target_lower,
             "description": f"Find element containing text '{target}' (case insensitive)"
         })
         
@@ -206,7 +466,7 @@ class DynamicAutomationExecutor:
             ])
         
         # ID and class-based selectors
-        target_id = target_lower.replace(" ", "_").replace("-", "_")
+        target_id = target_lower.translate(_TARGET_TABLE)
         strategies.extend([
             {
                 "type": "css_id",
@@ -220,7 +480,13 @@ class DynamicAutomationExecutor:
             }
         ])
         
-        return strategies
+        # Targets like "search input field" can yield the same selector twice
+        seen = set()
+        return tuple(
+            strategy for strategy in strategies
+            if (strategy["type"], strategy["selector"]) not in seen
+            and not seen.add((strategy["type"], strategy["selector"]))
+        )
     
     def execute_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the automation plan"""
@@ -246,9 +512,6 @@ class DynamicAutomationExecutor:
                 screenshot_result = self.take_screenshot(f"step_{step['step_number']}")
                 if screenshot_result.get("success"):
                     results["screenshots"].append(screenshot_result["filepath"])
-                
-                # Small delay between steps
-                time.sleep(1)
                             
             except Exception as e:
                 error_msg = f"Step {step['step_number']} failed: {str(e)}"
@@ -259,6 +522,8 @@ class DynamicAutomationExecutor:
                     "error": error_msg
                 })
         
+        # Reported screenshot paths must exist on disk
+        self._flush_screenshots()
         results["success"] = results["steps_executed"] == len(plan["steps"])
         return results
     
@@ -270,20 +535,24 @@ class DynamicAutomationExecutor:
         
         try:
             if action == "click":
-                return self.smart_click(target, step["selector_strategies"])
+                result = self.smart_click(target, step["selector_strategies"])
             elif action == "type":
-                return self.smart_type(target, value, step["selector_strategies"])
+                result = self.smart_type(target, value, step["selector_strategies"])
             elif action == "navigate":
-                return self.navigate_to_url(target)
+                result = self.navigate_to_url(target)
             elif action == "search":
-                return self.perform_search(value or target)
+                result = self.perform_search(value or target)
             elif action == "submit":
-                return self.submit_form(target)
+                result = self.submit_form(target)
             elif action == "find":
                 return self.find_element(target, step["selector_strategies"])
             else:
                 return self.generic_action(action, target, value)
             
+            # Let the page settle before the next step (and its screenshot)
+            self._wait_dom_quiet()
+            return result
+            
         except Exception as e:
             return {
                 "step": step["step_number"],
@@ -295,16 +564,14 @@ class DynamicAutomationExecutor:
     
     def smart_click(self, target: str, strategies: List[Dict[str, str]]) -> Dict[str, Any]:
         """Intelligent element clicking with multiple strategies"""
-        for strategy in strategies:
+        for strategy, element in self.locate_candidates(strategies):
             try:
-                element = self.find_element_by_strategy(strategy)
                 if element:
-                    # Scroll element into view
-                    self.current_driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                    time.sleep(0.5)
-                    
-                    # Try to click
-                    element.click()
+                    # Scroll and click in one round trip; a native click handles hidden or overlaid elements
+                    if not self.current_driver.execute_script(_SCROLL_CLICK_SCRIPT, element):
+                        element.click()
+                    # The click may have changed the page; earlier misses can now match
+                    self._negative_cache.clear()
                     
                     return {
                         "success": True,
@@ -325,9 +592,8 @@ class DynamicAutomationExecutor:
     
     def smart_type(self, target: str, value: str, strategies: List[Dict[str, str]]) -> Dict[str, Any]:
         """Intelligent text input with multiple strategies"""
-        for strategy in strategies:
+        for strategy, element in self.locate_candidates(strategies):
             try:
-                element = self.find_element_by_strategy(strategy)
                 if element and element.tag_name in ["input", "textarea"]:
                     # Clear and type
                     element.clear()
@@ -352,27 +618,86 @@ class DynamicAutomationExecutor:
             "error": f"Could not find input element for '{target}'"
         }
     
+    def locate_candidates(self, strategies, timeout: int = 5) -> List[Tuple[Dict[str, str], Any]]:
+        """Find elements for all strategies at once, as (strategy, element) pairs in strategy order"""
+        url = self.current_driver.current_url
+        
+        # Elements already found on this page that are still attached
+        cached = []
+        for strategy in strategies:
+            key = (url, strategy["type"], strategy["selector"])
+            element = self.element_cache.get(key)
+            if element is not None:
+                try:
+                    element.is_displayed()
+                    cached.append((strategy, element))
+                except StaleElementReferenceException:
+                    del self.element_cache[key]
+        if cached:
+            return cached
+        
+        # Skip lookups that already timed out on this page
+        live = [s for s in strategies if (url, s["type"], s["selector"]) not in self._negative_cache]
+        if not live:
+            return []
+        
+        # One script call per polling tick, sharing a single timeout across all strategies
+        pairs = [[_locator_kind(strategy["type"]), strategy["selector"]] for strategy in live]
+        try:
+            found = self._wait(timeout).until(
+                lambda d: d.execute_script(_LOCATE_SCRIPT, pairs)
+            )
+        except TimeoutException:
+            self._negative_cache.update((url, s["type"], s["selector"]) for s in live)
+            return []
+        
+        candidates = []
+        for index, element in found:
+            strategy = live[index]
+            self.element_cache[(url, strategy["type"], strategy["selector"])] = element
+            candidates.append((strategy, element))
+        return candidates
+    
     def find_element_by_strategy(self, strategy: Dict[str, str]):
         """Find element using a specific strategy"""
         selector = strategy["selector"]
         strategy_type = strategy["type"]
+        key = (self.current_driver.current_url, strategy_type, selector)
+        
+        # Reuse an element found earlier on this page if it is still attached
+        element = self.element_cache.get(key)
+        if element is not None:
+            try:
+                element.is_displayed()
+                return element
+            except StaleElementReferenceException:
+                del self.element_cache[key]
+        if key in self._negative_cache:
+            return None
         
         try:
-            wait = WebDriverWait(self.current_driver, 5)
+            wait = self._wait(5)
             
-            if strategy_type.startswith("xpath"):
-                return wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-            elif strategy_type.startswith("css"):
-                return wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+            kind = _locator_kind(strategy_type)
+            if kind == "text":
+                element = wait.until(lambda d: d.execute_script(_FIND_TEXT_SCRIPT, selector))
+            elif kind == "xpath":
+                element = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
+            elif kind == "css":
+                element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
             else:
                 # Try CSS first, then XPath
                 try:
-                    return wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                    element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
                 except:
-                    return wait.until(EC.presence_of_element_located((By.XPATH, selector)))
+                    element = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
                     
         except TimeoutException:
+            self._negative_cache.add(key)
             return None
+        
+        self.element_cache[key] = element
+        return element
     
     def navigate_to_url(self, url: str) -> Dict[str, Any]:
         """Navigate to a URL"""
@@ -381,7 +706,9 @@ class DynamicAutomationExecutor:
                 url = f"https://{url}"
             
             self.current_driver.get(url)
-            time.sleep(2)
+            self.element_cache.clear()
+            self._negative_cache.clear()
+            self._wait_ready()
             
             return {
                 "success": True,
@@ -399,22 +726,9 @@ class DynamicAutomationExecutor:
     
     def perform_search(self, query: str) -> Dict[str, Any]:
         """Perform a search operation"""
-        # Common search field selectors
-        search_selectors = [
-            "input[type='search']",
-            "input[name*='search']",
-            "input[placeholder*='search' i]",
-            "input[id*='search']",
-            ".search-input",
-            "#search",
-            "[role='searchbox']"
-        ]
-        
-        for selector in search_selectors:
+        # All common search field selectors are polled together
+        for strategy, element in self.locate_candidates(_SEARCH_STRATEGIES, timeout=2):
             try:
-                element = WebDriverWait(self.current_driver, 2).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
                 element.clear()
                 element.send_keys(query)
                 element.send_keys(Keys.RETURN)
@@ -423,7 +737,7 @@ class DynamicAutomationExecutor:
                     "success": True,
                     "action": "search",
                     "query": query,
-                    "selector_used": selector,
+                    "selector_used": strategy["selector"],
                     "message": f"Successfully searched for '{query}'"
                 }
             except:
@@ -439,27 +753,18 @@ class DynamicAutomationExecutor:
     def submit_form(self, form_identifier: str) -> Dict[str, Any]:
         """Submit a form"""
         try:
-            # Try different form submission strategies
-            strategies = [
-                ("css", f"form#{form_identifier}"),
-                ("css", f"form.{form_identifier}"),
-                ("css", f"input[type='submit']"),
-                ("css", f"button[type='submit']"),
-                ("xpath", f"//form[contains(@class, '{form_identifier}')]"),
-                ("xpath", "//input[@type='submit'] | //button[@type='submit']")
-            ]
+            # Try different form submission strategies, polled together
+            strategies = (
+                {"type": "css_form", "selector": f"form#{form_identifier}"},
+                {"type": "css_form", "selector": f"form.{form_identifier}"},
+                {"type": "css_submit", "selector": "input[type='submit']"},
+                {"type": "css_submit", "selector": "button[type='submit']"},
+                {"type": "xpath_form", "selector": f"//form[contains(@class, '{form_identifier}')]"},
+                {"type": "xpath_submit", "selector": "//input[@type='submit'] | //button[@type='submit']"}
+            )
             
-            for strategy_type, selector in strategies:
+            for strategy, element in self.locate_candidates(strategies, timeout=2):
                 try:
-                    if strategy_type == "css":
-                        element = WebDriverWait(self.current_driver, 2).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    else:
-                        element = WebDriverWait(self.current_driver, 2).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                    
                     if element.tag_name == "form":
                         element.submit()
                     else:
@@ -491,26 +796,10 @@ class DynamicAutomationExecutor:
     
     def find_element(self, target: str, strategies: List[Dict[str, str]]) -> Dict[str, Any]:
         """Find an element and return information about it"""
-        for strategy in strategies:
+        for strategy, element in self.locate_candidates(strategies):
             try:
-                element = self.find_element_by_strategy(strategy)
                 if element:
-                    element_info = {
-                        "tag_name": element.tag_name,
-                        "text": element.text[:100],  # Limit text length
-                        "attributes": {},
-                        "location": element.location,
-                        "size": element.size
-                    }
-                    
-                    # Get common attributes
-                    for attr in ["id", "class", "name", "type", "value", "href"]:
-                        try:
-                            value = element.get_attribute(attr)
-                            if value:
-                                element_info["attributes"][attr] = value
-                        except:
-                            pass
+                    element_info = self.current_driver.execute_script(_ELEMENT_INFO_SCRIPT, element)
                     
                     return {
                         "success": True,
@@ -540,18 +829,22 @@ class DynamicAutomationExecutor:
             "message": f"Executed generic action: {action} on {target}"
         }
     
-    def take_screenshot(self, filename: str = None) -> Dict[str, Any]:
-        """Take a screenshot"""
+    def take_screenshot(self, filename: str = None, to_disk: bool = True) -> Dict[str, Any]:
+        """Take a screenshot, or return it base64-encoded without writing a file when to_disk is False"""
         try:
+            if not to_disk:
+                return {
+                    "success": True,
+                    "b64": self.current_driver.get_screenshot_as_base64()
+                }
+            
             if not filename:
                 timestamp = int(time.time())
                 filename = f"dynamic_automation_{timestamp}.png"
-            
-            screenshots_dir = os.path.join(os.getcwd(), "screenshots")
-            os.makedirs(screenshots_dir, exist_ok=True)
         
-            filepath = os.path.join(screenshots_dir, filename)
-            self.current_driver.save_screenshot(filepath)
+            filepath = os.path.join(self._screenshots_dir, filename)
+            png = self.current_driver.get_screenshot_as_png()
+            self._pending_screenshots.append(self._screenshot_pool.submit(_write_png, filepath, png))
             
             return {
                 "success": True,
@@ -564,11 +857,24 @@ class DynamicAutomationExecutor:
                 "error": f"Screenshot failed: {str(e)}"
             }
     
+    def _flush_screenshots(self):
+        """Wait for queued screenshot writes to finish"""
+        if self._pending_screenshots:
+            wait(self._pending_screenshots)
+            self._pending_screenshots.clear()
+    
     def close_driver(self):
-        """Close the current driver"""
-        if self.current_driver:
+        """Close the current driver and every pooled one"""
+        self._flush_screenshots()
+        drivers = [self.current_driver] if self.current_driver else []
+        self.current_driver = None
+        while True:
+            try:
+                drivers.append(self._driver_pool.get_nowait())
+            except queue.Empty:
+                break
+        for driver in drivers:
             try:
-                self.current_driver.quit()
-                self.current_driver = None
+                driver.quit()
             except:
                 pass 
\ No newline at end of file
@@ -2,44 +2,249 @@
 Dynamic Automation Executor with AI page analysis
 """
 import os
+import re
+import socket
 import time
+import base64
+import queue
+import atexit
+import functools
+import itertools
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+from hashlib import blake2b
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from importlib.util import find_spec
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
-try:
+# webdriver-manager (and the Edge driver classes) are only imported when a driver is set up
+WEBDRIVER_MANAGER_AVAILABLE = find_spec("webdriver_manager") is not None
+
+@functools.lru_cache(maxsize=1)
+def _chrome_driver_path() -> str:
+    """Resolve chromedriver once per process."""
     from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+@functools.lru_cache(maxsize=1)
+def _edge_driver_path() -> str:
+    """Resolve msedgedriver once per process."""
     from webdriver_manager.microsoft import EdgeChromiumDriverManager
-    WEBDRIVER_MANAGER_AVAILABLE = True
-except ImportError:
-    WEBDRIVER_MANAGER_AVAILABLE = False
+    return EdgeChromiumDriverManager().install()
+
+def _edge_service():
+    """Edge service for the resolved msedgedriver."""
+    from selenium.webdriver.edge.service import Service as EdgeService
+    return EdgeService(_edge_driver_path())
+
+# Prompt intents, checked in this order. Only the start of a word is anchored,
+# so "testing" or "clicking" still match but "contest" does not
+_LOGIN_RE = re.compile(r'\b(?:login|test)')
+_CLICK_RE = re.compile(r'\b(?:click|press|tap)')
+_FILL_RE = re.compile(r'\b(?:fill|enter|type|input)')
+_SUBMIT_RE = re.compile(r'\b(?:submit|send|search)')
+_NAV_RE = re.compile(r'\b(?:navigate|go to|visit)')
+# Input name/id that looks like a username field
+_USER_FIELD_RE = re.compile(r'user|email|login')
+
+def _stamp_entries(entries: List[Dict[str, Any]], start_time: float, t0_ns: int):
+    """Replace each entry's monotonic ts_ns offset with an ISO timestamp."""
+    for entry in entries:
+        offset_ns = entry.pop("ts_ns", None)
+        if offset_ns is not None:
+            entry["timestamp"] = datetime.fromtimestamp(start_time + offset_ns / 1e9).isoformat()
+
+# Equivalent-code templates, filled per step and joined once
+_SELENIUM_HEADER = """from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import time
+
+# Setup Chrome driver
+options = Options()
+options.add_argument('--headless')
+driver = webdriver.Chrome(options=options)
+
+try:
+    # Navigate to the website
+    driver.get('{url}')
+    time.sleep(2)
+
+"""
+_SELENIUM_FOOTER = """finally:
+    # Cleanup
+    driver.quit()"""
+_SELENIUM_STEP_TEMPLATES = {
+    "click": """    element = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable((By.{by}, '{selector}'))
+    )
+    element.click()
+""",
+    "fill": """    element = WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.{by}, '{selector}'))
+    )
+    element.clear()
+    element.send_keys('{value}')
+""",
+    "submit": """    form = WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, '{selector}'))
+    )
+    form.submit()
+""",
+    "navigate": """    driver.get('{url}')
+""",
+}
+_SELENIUMBASE_HEADER = """from seleniumbase import BaseCase
+
+class AutomationTest(BaseCase):
+    def test_automation(self):
+        # Navigate to the website
+        self.open('{url}')
+"""
+_SELENIUMBASE_STEP_TEMPLATES = {
+    "click": "\n        self.click('{selector}')",
+    "fill": "\n        self.type('{selector}', '{value}')",
+    "submit": "\n        self.submit('{selector}')",
+    "navigate": "\n        self.open('{url}')",
+}
+
+# Connections kept open to the driver server, so concurrent commands don't queue on one socket
+DRIVER_CONNECTIONS = 10
+
+def _widen_connection_pool(driver):
+    """Let the driver's urllib3 PoolManager keep DRIVER_CONNECTIONS connections per host."""
+    # Selenium 4.15 has no ClientConfig, so adjust the pool manager it built
+    conn = getattr(driver.command_executor, "_conn", None)
+    if conn is not None and hasattr(conn, "connection_pool_kw"):
+        conn.connection_pool_kw["maxsize"] = DRIVER_CONNECTIONS
+        # Drop the single-connection pool opened for the session; the next request builds a wider one
+        conn.clear()
+    return driver
+
+# A long-lived browser to open tabs in instead of launching one per run
+# (start it with --remote-debugging-port, e.g. launch_shared_browser.py)
+SHARED_BROWSER_ENV = "AUTOMATION_CDP_ENDPOINT"
+
+def _cdp_endpoint_reachable(endpoint: str) -> bool:
+    """Quick probe for a browser listening on host:port."""
+    host, _, port = endpoint.rpartition(":")
+    try:
+        with socket.create_connection((host or "127.0.0.1", int(port)), 0.2):
+            return True
+    except (OSError, ValueError):
+        return False
+
+# Warm drivers kept for reuse between runs; extras are quit on release
+DRIVER_POOL_SIZE = 2
+
+# Arguments for every browser this executor launches
+BROWSER_ARGS = ("--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--disable-extensions")
+
+def _make_chrome_options() -> ChromeOptions:
+    """Fresh Chrome options with the shared arguments."""
+    options = ChromeOptions()
+    # Return from navigation at DOMContentLoaded; steps wait for their own elements
+    options.page_load_strategy = 'eager'
+    for arg in BROWSER_ARGS:
+        options.add_argument(arg)
+    return options
+
+def _make_edge_options():
+    """Fresh Edge options with the shared arguments."""
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    
+    options = EdgeOptions()
+    options.page_load_strategy = 'eager'
+    for arg in BROWSER_ARGS:
+        options.add_argument(arg)
+    return options
+
+# Images are blocked per run (pooled browsers outlive a single prompt) unless the prompt is about them
+_IMAGE_PROMPT_RE = re.compile(r'\b(?:image|img|photo|picture|logo|icon|visual|screenshot)')
+BLOCKED_IMAGE_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"]
+
+# Upper bound for post-action settling (the old fixed sleep), polled every 50ms
+SETTLE_TIMEOUT = 1
+SETTLE_POLL = 0.05
+
+def _document_ready(driver) -> bool:
+    # Pages load eagerly, so the DOM being parsed is enough; subresources may still be loading
+    return driver.execute_script("return document.readyState") != "loading"
+
+def _document_complete(driver) -> bool:
+    # Subresources have finished loading too
+    return driver.execute_script("return document.readyState") == "complete"
+
+# Collects everything page analysis reads in one round trip instead of one per attribute
+PAGE_ELEMENTS_SCRIPT = """
+var page = {buttons: [], links: [], inputs: [], forms: 0};
+// One DOM traversal, partitioned by tag
+document.querySelectorAll('button,a,input,form').forEach(function (e) {
+    switch (e.tagName) {
+        case 'BUTTON':
+            page.buttons.push({text: e.innerText || ''});
+            break;
+        case 'A':
+            page.links.push({text: e.innerText || '', href: e.href || ''});
+            break;
+        case 'INPUT':
+            page.inputs.push({type: e.type || '', name: e.name || '', id: e.id || '', placeholder: e.placeholder || ''});
+            break;
+        case 'FORM':
+            page.forms++;
+            break;
+    }
+});
+return page;
+"""
 
 class DynamicAutomationExecutor:
     """Executor for dynamic automation with AI-powered page analysis."""
     
+    # Shared by all executors; Queue does its own locking
+    _driver_pool = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+    
     def __init__(self):
         self.screenshots_dir = Path("screenshots")
         self.screenshots_dir.mkdir(exist_ok=True)
         self.driver = None
+        # Whether self.driver is a tab in the shared browser rather than its own process
+        self._driver_shared = False
+        # Digest and path of the last screenshot written, to skip identical frames
+        self._last_screenshot_hash = None
+        self._last_screenshot_path = None
+        # Screenshot files are written here while the next step runs
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
+        # Screenshot names: run start time plus a counter that never repeats within this executor
+        self._run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._shot_counter = itertools.count()
     
     def execute_automation(self, prompt: str, website_url: str, framework: str = "selenium", timeout: int = 180) -> Dict[str, Any]:
         """Execute dynamic automation based on natural language prompt."""
         start_time = time.time()
+        # Entries record a monotonic offset; ISO timestamps are formatted once on return
+        t0_ns = time.monotonic_ns()
         logs = []
         screenshots = []
         context_chain = []
         function_calls = []
         
+        self._last_screenshot_hash = None
+        self._last_screenshot_path = None
+        self._run_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         try:
             # Initialize browser
             self.driver = self._initialize_browser()
@@ -49,7 +254,7 @@ class DynamicAutomationExecutor:
             logs.append({
                 "level": "info",
                 "message": f"Dynamic automation started with {framework}",
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.monotonic_ns() - t0_ns,
                 "source": "dynamic_executor"
             })
             
@@ -59,10 +264,11 @@ class DynamicAutomationExecutor:
             logs.append({
                 "level": "info",
                 "message": f"Navigating to: {website_url}",
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.monotonic_ns() - t0_ns,
                 "source": "dynamic_executor"
             })
             
+            self._block_images(not _IMAGE_PROMPT_RE.search(prompt.lower()))
             self.driver.get(website_url)
             context_chain.append(f"Navigated to {website_url}")
             
@@ -83,28 +289,29 @@ class DynamicAutomationExecutor:
             logs.append({
                 "level": "info",
                 "message": f"Generated {len(automation_steps)} automation steps",
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.monotonic_ns() - t0_ns,
                 "source": "dynamic_executor"
             })
             
-            # Execute automation steps
+            # Execute automation steps; elements located by one step are reused by later ones
+            selector_cache = {}
             for i, step in enumerate(automation_steps):
                 try:
                     logs.append({
                         "level": "info",
                         "message": f"Executing step {i+1}: {step['description']}",
-                        "timestamp": datetime.now().isoformat(),
+                        "ts_ns": time.monotonic_ns() - t0_ns,
                         "source": "dynamic_executor"
                     })
                     
-                    self._execute_step(step)
+                    self._execute_step(step, selector_cache)
                     
                     function_calls.append({
                         "step": i + 1,
                         "action": step['action'],
                         "description": step['description'],
                         "success": True,
-                        "timestamp": datetime.now().isoformat()
+                        "ts_ns": time.monotonic_ns() - t0_ns
                     })
                     
                     context_chain.append(f"Completed step {i+1}: {step['description']}")
@@ -119,7 +326,7 @@ class DynamicAutomationExecutor:
                     logs.append({
                         "level": "warning",
                         "message": f"Step {i+1} failed: {str(step_error)}",
-                        "timestamp": datetime.now().isoformat(),
+                        "ts_ns": time.monotonic_ns() - t0_ns,
                         "source": "dynamic_executor"
                     })
                     
@@ -129,7 +336,7 @@ class DynamicAutomationExecutor:
                         "description": step['description'],
                         "success": False,
                         "error": str(step_error),
-                        "timestamp": datetime.now().isoformat()
+                        "ts_ns": time.monotonic_ns() - t0_ns
                     })
                     
                     context_chain.append(f"Step {i+1} failed: {str(step_error)}")
@@ -147,10 +354,12 @@ class DynamicAutomationExecutor:
             logs.append({
                 "level": "info",
                 "message": f"Dynamic automation completed in {execution_time:.2f}s",
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.monotonic_ns() - t0_ns,
                 "source": "dynamic_executor"
             })
             
+            _stamp_entries(logs, start_time, t0_ns)
+            _stamp_entries(function_calls, start_time, t0_ns)
             return {
                 "success": True,
                 "logs": logs,
@@ -179,11 +388,13 @@ class DynamicAutomationExecutor:
             logs.append({
                 "level": "error",
                 "message": f"Dynamic automation failed: {str(e)}",
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.monotonic_ns() - t0_ns,
                 "source": "dynamic_executor",
                 "traceback": traceback.format_exc()
             })
             
+            _stamp_entries(logs, start_time, t0_ns)
+            _stamp_entries(function_calls, start_time, t0_ns)
             return {
                 "success": False,
                 "logs": logs,
@@ -197,23 +408,32 @@ class DynamicAutomationExecutor:
             }
             
         finally:
-            self._close_driver()
+            # Reported screenshot paths must exist once the run returns
+            self._flush_screenshots()
+            self._release_driver()
     
     def _initialize_browser(self):
-        """Initialize browser with Chrome/Edge fallback."""
+        """Open a tab in the shared browser, take a warm pooled one, or start one with Chrome/Edge fallback."""
+        self._driver_shared = False
+        shared = self._attach_shared_browser()
+        if shared:
+            self._driver_shared = True
+            return shared
+        
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+        
         # Try Chrome first
         try:
-            options = ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
+            options = _make_chrome_options()
             
             if WEBDRIVER_MANAGER_AVAILABLE:
-                service = ChromeService(ChromeDriverManager().install())
-                return webdriver.Chrome(service=service, options=options)
+                service = ChromeService(_chrome_driver_path())
+                return _widen_connection_pool(webdriver.Chrome(service=service, options=options))
             else:
-                return webdriver.Chrome(options=options)
+                return _widen_connection_pool(webdriver.Chrome(options=options))
                 
         except Exception as chrome_error:
             concise_error = self._extract_concise_error(chrome_error)
@@ -221,17 +441,13 @@ class DynamicAutomationExecutor:
             
             # Fallback to Edge
             try:
-                options = EdgeOptions()
-                options.add_argument("--headless")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-gpu")
+                options = _make_edge_options()
                 
                 if WEBDRIVER_MANAGER_AVAILABLE:
-                    service = EdgeService(EdgeChromiumDriverManager().install())
-                    return webdriver.Edge(service=service, options=options)
+                    service = _edge_service()
+                    return _widen_connection_pool(webdriver.Edge(service=service, options=options))
                 else:
-                    return webdriver.Edge(options=options)
+                    return _widen_connection_pool(webdriver.Edge(options=options))
                     
             except Exception as edge_error:
                 concise_error = self._extract_concise_error(edge_error)
@@ -247,23 +463,22 @@ class DynamicAutomationExecutor:
         
         try:
             # Get page elements for analysis
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            links = self.driver.find_elements(By.TAG_NAME, "a")
-            inputs = self.driver.find_elements(By.TAG_NAME, "input")
-            forms = self.driver.find_elements(By.TAG_NAME, "form")
+            page = self.driver.execute_script(PAGE_ELEMENTS_SCRIPT)
+            buttons = page["buttons"]
+            links = page["links"]
+            inputs = page["inputs"]
             
             # Simple prompt analysis for common actions
             prompt_lower = prompt.lower()
             
             # Login test specific
-            if "login" in prompt_lower or "test" in prompt_lower:
+            if _LOGIN_RE.search(prompt_lower):
                 # Find username/email input
                 for inp in inputs:
-                    input_type = inp.get_attribute('type') or 'text'
-                    name = inp.get_attribute('name') or ''
-                    id_attr = inp.get_attribute('id') or ''
+                    name = inp['name']
+                    id_attr = inp['id']
                     
-                    if any(keyword in (name + id_attr).lower() for keyword in ['user', 'email', 'login']):
+                    if _USER_FIELD_RE.search((name + id_attr).lower()):
                         steps.append({
                             "action": "fill",
                             "element": "input",
@@ -275,10 +490,7 @@ class DynamicAutomationExecutor:
                 
                 # Find password input
                 for inp in inputs:
-                    input_type = inp.get_attribute('type') or 'text'
-                    if input_type == 'password':
-                        name = inp.get_attribute('name') or ''
-                        id_attr = inp.get_attribute('id') or ''
+                    if inp['type'] == 'password':
                         steps.append({
                             "action": "fill",
                             "element": "input",
@@ -290,20 +502,20 @@ class DynamicAutomationExecutor:
                 
                 # Find submit button
                 for button in buttons:
-                    text = button.text.strip().lower()
-                    if any(keyword in text for keyword in ['submit', 'login', 'sign in']):
+                    text = button['text'].strip()
+                    if any(keyword in text.lower() for keyword in ['submit', 'login', 'sign in']):
                         steps.append({
                             "action": "click",
                             "element": "button",
-                            "selector": f"//button[contains(text(), '{button.text.strip()}')]",
-                            "description": f"Click '{button.text.strip()}' button"
+                            "selector": f"//button[contains(text(), '{text}')]",
+                            "description": f"Click '{text}' button"
                         })
                         break
             
             # Click actions
-            elif any(word in prompt_lower for word in ['click', 'press', 'tap']):
+            elif _CLICK_RE.search(prompt_lower):
                 for button in buttons[:3]:  # Limit to first 3 buttons
-                    text = button.text.strip()
+                    text = button['text'].strip()
                     if text and len(text) < 50:
                         steps.append({
                             "action": "click",
@@ -313,11 +525,11 @@ class DynamicAutomationExecutor:
                         })
             
             # Fill form actions
-            elif any(word in prompt_lower for word in ['fill', 'enter', 'type', 'input']):
+            elif _FILL_RE.search(prompt_lower):
                 for inp in inputs[:3]:  # Limit to first 3 inputs
-                    input_type = inp.get_attribute('type') or 'text'
-                    placeholder = inp.get_attribute('placeholder') or ''
-                    name = inp.get_attribute('name') or ''
+                    input_type = inp['type'] or 'text'
+                    placeholder = inp['placeholder']
+                    name = inp['name']
                     
                     if input_type in ['text', 'email', 'password']:
                         value = "test_value"
@@ -335,8 +547,8 @@ class DynamicAutomationExecutor:
                         })
             
             # Submit actions
-            elif any(word in prompt_lower for word in ['submit', 'send', 'search']):
-                for form in forms[:1]:  # Limit to first form
+            elif _SUBMIT_RE.search(prompt_lower):
+                if page["forms"]:  # Only the first form
                     steps.append({
                         "action": "submit",
                         "element": "form",
@@ -345,10 +557,10 @@ class DynamicAutomationExecutor:
                     })
             
             # Navigation actions
-            elif any(word in prompt_lower for word in ['navigate', 'go to', 'visit']):
+            elif _NAV_RE.search(prompt_lower):
                 for link in links[:3]:  # Limit to first 3 links
-                    text = link.text.strip()
-                    href = link.get_attribute('href')
+                    text = link['text'].strip()
+                    href = link['href']
                     if text and href and len(text) < 50:
                         steps.append({
                             "action": "navigate",
@@ -378,60 +590,82 @@ class DynamicAutomationExecutor:
         
         return steps
     
-    def _execute_step(self, step: Dict[str, Any]):
+    def _execute_step(self, step: Dict[str, Any], selector_cache: Optional[Dict[tuple, Any]] = None):
         """Execute a single automation step."""
         if not self.driver:
             return
             
         action = step['action']
         selector = step['selector']
+        by = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
         
         try:
             if action == "click":
-                if selector.startswith("//"):
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
+                element = self._locate(EC.element_to_be_clickable, by, selector, selector_cache)
+                current_url = self.driver.current_url
                 element.click()
+                # Done as soon as the click replaces the element or changes the page
+                self._settle(EC.any_of(EC.staleness_of(element), EC.url_changes(current_url)))
                 
             elif action == "fill":
-                if selector.startswith("//"):
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
+                element = self._locate(EC.presence_of_element_located, by, selector, selector_cache)
+                value = step.get('value', 'test_value')
                 element.clear()
-                element.send_keys(step.get('value', 'test_value'))
+                element.send_keys(value)
+                self._settle(lambda d: element.get_attribute('value') == value)
                 
             elif action == "submit":
-                form = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
+                form = self._locate(EC.presence_of_element_located, By.CSS_SELECTOR, selector, selector_cache)
+                current_url = self.driver.current_url
                 form.submit()
+                self._settle(EC.any_of(EC.staleness_of(form), EC.url_changes(current_url)))
                 
             elif action == "navigate":
                 url = step.get('url')
                 if url:
                     self.driver.get(url)
+                    self._settle(_document_ready)
                     
             elif action == "analyze":
-                # Just wait for analysis
-                time.sleep(2)
-                
-            # Wait a bit after each action
-            time.sleep(1)
+                # Wait (up to 2s) for subresources, which eager navigation doesn't wait for
+                self._settle(_document_complete, timeout=2)
             
         except Exception as e:
             print(f"Step execution failed: {e}")
             raise
     
+    def _locate(self, condition, by: str, selector: str, cache: Optional[Dict[tuple, Any]] = None):
+        """Wait for an element, reusing one found by an earlier step of the run while it is still attached."""
+        key = (by, selector)
+        if cache is not None and key in cache:
+            try:
+                if cache[key].is_enabled():
+                    return cache[key]
+            except StaleElementReferenceException:
+                pass
+            del cache[key]
+        
+        element = WebDriverWait(self.driver, 10).until(condition(key))
+        if cache is not None:
+            cache[key] = element
+        return element
+    
+    def _block_images(self, block: bool):
+        """Block or unblock image requests for the current run through CDP."""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_IMAGE_URLS if block else []})
+        except Exception:
+            # Not a Chromium driver; load everything
+            pass
+    
+    def _settle(self, condition, timeout: float = SETTLE_TIMEOUT):
+        """Wait for a post-action condition, giving up quietly after timeout."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=SETTLE_POLL).until(condition)
+        except TimeoutException:
+            pass
+    
     def _generate_equivalent_code(self, steps: List[Dict[str, Any]], website_url: str, framework: str) -> str:
         """Generate equivalent Selenium/SeleniumBase code."""
         if framework == "seleniumbase":
@@ -441,107 +675,44 @@ class DynamicAutomationExecutor:
     
     def _generate_selenium_code(self, steps: List[Dict[str, Any]], website_url: str) -> str:
         """Generate Selenium code."""
-        code_lines = [
-            "from selenium import webdriver",
-            "from selenium.webdriver.common.by import By",
-            "from selenium.webdriver.chrome.options import Options",
-            "from selenium.webdriver.support.ui import WebDriverWait",
-            "from selenium.webdriver.support import expected_conditions as EC",
-            "import time",
-            "",
-            "# Setup Chrome driver",
-            "options = Options()",
-            "options.add_argument('--headless')",
-            "driver = webdriver.Chrome(options=options)",
-            "",
-            "try:",
-            f"    # Navigate to the website",
-            f"    driver.get('{website_url}')",
-            "    time.sleep(2)",
-            ""
-        ]
+        parts = [_SELENIUM_HEADER.format(url=website_url)]
         
         for i, step in enumerate(steps):
-            code_lines.append(f"    # Step {i+1}: {step['description']}")
-            
-            if step['action'] == 'click':
-                if step['selector'].startswith("//"):
-                    code_lines.append(f"    element = WebDriverWait(driver, 10).until(")
-                    code_lines.append(f"        EC.element_to_be_clickable((By.XPATH, '{step['selector']}'))")
-                    code_lines.append(f"    )")
-                    code_lines.append(f"    element.click()")
-                else:
-                    code_lines.append(f"    element = WebDriverWait(driver, 10).until(")
-                    code_lines.append(f"        EC.element_to_be_clickable((By.CSS_SELECTOR, '{step['selector']}'))")
-                    code_lines.append(f"    )")
-                    code_lines.append(f"    element.click()")
-                    
-            elif step['action'] == 'fill':
-                value = step.get('value', 'test_value')
-                if step['selector'].startswith("//"):
-                    code_lines.append(f"    element = WebDriverWait(driver, 10).until(")
-                    code_lines.append(f"        EC.presence_of_element_located((By.XPATH, '{step['selector']}'))")
-                    code_lines.append(f"    )")
-                else:
-                    code_lines.append(f"    element = WebDriverWait(driver, 10).until(")
-                    code_lines.append(f"        EC.presence_of_element_located((By.CSS_SELECTOR, '{step['selector']}'))")
-                    code_lines.append(f"    )")
-                code_lines.append("    element.clear()")
-                code_lines.append(f"    element.send_keys('{value}')")
-                
-            elif step['action'] == 'submit':
-                code_lines.append(f"    form = WebDriverWait(driver, 10).until(")
-                code_lines.append(f"        EC.presence_of_element_located((By.CSS_SELECTOR, '{step['selector']}'))")
-                code_lines.append(f"    )")
-                code_lines.append(f"    form.submit()")
-                
-            elif step['action'] == 'navigate':
-                url = step.get('url', '')
-                code_lines.append(f"    driver.get('{url}')")
+            parts.append(f"    # Step {i+1}: {step['description']}\n")
+            
+            template = _SELENIUM_STEP_TEMPLATES.get(step['action'])
+            if template:
+                by = "XPATH" if step['selector'].startswith("//") else "CSS_SELECTOR"
+                parts.append(template.format(
+                    by=by,
+                    selector=step['selector'],
+                    value=step.get('value', 'test_value'),
+                    url=step.get('url', '')
+                ))
                 
-            code_lines.append("    time.sleep(1)")
-            code_lines.append("")
+            parts.append("    time.sleep(1)\n\n")
         
-        code_lines.extend([
-            "finally:",
-            "    # Cleanup",
-            "    driver.quit()"
-        ])
-        
-        return "\n".join(code_lines)
+        parts.append(_SELENIUM_FOOTER)
+        return "".join(parts)
     
     def _generate_seleniumbase_code(self, steps: List[Dict[str, Any]], website_url: str) -> str:
         """Generate SeleniumBase code."""
-        code_lines = [
-            "from seleniumbase import BaseCase",
-            "",
-            "class AutomationTest(BaseCase):",
-            "    def test_automation(self):",
-            f"        # Navigate to the website",
-            f"        self.open('{website_url}')",
-            ""
-        ]
+        parts = [_SELENIUMBASE_HEADER.format(url=website_url)]
         
         for i, step in enumerate(steps):
-            code_lines.append(f"        # Step {i+1}: {step['description']}")
-            
-            if step['action'] == 'click':
-                code_lines.append(f"        self.click('{step['selector']}')")
+            parts.append(f"\n        # Step {i+1}: {step['description']}")
+            
+            template = _SELENIUMBASE_STEP_TEMPLATES.get(step['action'])
+            if template:
+                parts.append(template.format(
+                    selector=step['selector'],
+                    value=step.get('value', 'test_value'),
+                    url=step.get('url', '')
+                ))
                 
-            elif step['action'] == 'fill':
-                value = step.get('value', 'test_value')
-                code_lines.append(f"        self.type('{step['selector']}', '{value}')")
-                
-            elif step['action'] == 'submit':
-                code_lines.append(f"        self.submit('{step['selector']}')")
-                
-            elif step['action'] == 'navigate':
-                url = step.get('url', '')
-                code_lines.append(f"        self.open('{url}')")
-                
-            code_lines.append("")
+            parts.append("\n")
         
-        return "\n".join(code_lines)
+        return "".join(parts)
     
     def _take_screenshot(self, name: str) -> Optional[str]:
         """Take and save a screenshot."""
@@ -549,20 +720,41 @@ class DynamicAutomationExecutor:
             return None
             
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
+            filename = f"{name}_{self._run_stamp}_{next(self._shot_counter):04d}.png"
             filepath = self.screenshots_dir / filename
             
-            self.driver.save_screenshot(str(filepath))
+            try:
+                # Straight from DevTools, skipping the WebDriver screenshot wrapper
+                data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'png', 'optimizeForSpeed': True})['data']
+                png = base64.b64decode(data)
+            except Exception:
+                png = self.driver.get_screenshot_as_png()
+            
+            # An unchanged page reuses the previous file instead of writing a duplicate
+            digest = blake2b(png, digest_size=8).digest()
+            if digest == self._last_screenshot_hash:
+                return self._last_screenshot_path
+            
+            self._pending_writes.append(self._io_pool.submit(filepath.write_bytes, png))
+            self._last_screenshot_hash = digest
+            self._last_screenshot_path = str(filepath)
             return str(filepath)
             
         except Exception as e:
             print(f"Failed to take screenshot: {e}")
             return None
     
+    def _flush_screenshots(self):
+        """Wait for queued screenshot writes to finish."""
+        if self._pending_writes:
+            wait(self._pending_writes)
+            self._pending_writes.clear()
+    
     def _close_driver(self):
         """Close the webdriver."""
-        if self.driver:
+        if self.driver and self._driver_shared:
+            self._release_driver()
+        elif self.driver:
             try:
                 self.driver.quit()
             except Exception as e:
@@ -570,9 +762,78 @@ class DynamicAutomationExecutor:
             finally:
                 self.driver = None
     
+    def _attach_shared_browser(self):
+        """Attach to the shared browser in a new tab, or None if none is running."""
+        endpoint = os.environ.get(SHARED_BROWSER_ENV)
+        if not endpoint or not _cdp_endpoint_reachable(endpoint):
+            return None
+        
+        try:
+            options = ChromeOptions()
+            options.add_experimental_option("debuggerAddress", endpoint)
+            options.page_load_strategy = 'eager'
+            
+            if WEBDRIVER_MANAGER_AVAILABLE:
+                driver = webdriver.Chrome(service=ChromeService(_chrome_driver_path()), options=options)
+            else:
+                driver = webdriver.Chrome(options=options)
+            
+            driver.switch_to.new_window("tab")
+            return _widen_connection_pool(driver)
+        except Exception as e:
+            print(f"Shared browser attach failed: {self._extract_concise_error(e)}")
+            return None
+    
+    def _detach_shared_browser(self, driver):
+        """Close our tab and stop its chromedriver; the shared browser stays up."""
+        try:
+            driver.close()
+            driver.service.stop()
+        except Exception as e:
+            print(f"Error closing tab: {e}")
+    
+    def _release_driver(self):
+        """Reset the webdriver and return it to the pool, quitting it if the pool is full."""
+        driver, self.driver = self.driver, None
+        if not driver:
+            return
+        if self._driver_shared:
+            # Cookies are shared with other tabs, so the tab is closed rather than reset and pooled
+            self._driver_shared = False
+            self._detach_shared_browser(driver)
+            return
+        try:
+            # delete_all_cookies only covers the current origin; CDP clears every site's cookies and storage
+            driver.delete_all_cookies()
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': 'all'})
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            driver.get("about:blank")
+            self._driver_pool.put_nowait(driver)
+        except Exception:
+            # Full pool or broken session
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+    
+    @classmethod
+    def _drain_pool(cls):
+        """Quit every pooled webdriver."""
+        while True:
+            try:
+                driver = cls._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+    
     def cleanup(self):
         """Clean up resources."""
         self._close_driver()
+        self._drain_pool()
 
     def _extract_concise_error(self, error_message: str) -> str:
         """Extract a concise error message from verbose Selenium errors."""
@@ -637,17 +898,13 @@ class DynamicAutomationExecutor:
     def _setup_driver(self):
         """Setup Chrome driver with Edge fallback."""
         try:
-            options = ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
+            options = _make_chrome_options()
             
             if WEBDRIVER_MANAGER_AVAILABLE:
-                service = ChromeService(ChromeDriverManager().install())
-                return webdriver.Chrome(service=service, options=options)
+                service = ChromeService(_chrome_driver_path())
+                return _widen_connection_pool(webdriver.Chrome(service=service, options=options))
             else:
-                return webdriver.Chrome(options=options)
+                return _widen_connection_pool(webdriver.Chrome(options=options))
                 
         except Exception as chrome_error:
             concise_error = self._extract_concise_error(chrome_error)
@@ -655,19 +912,18 @@ class DynamicAutomationExecutor:
             
             # Fallback to Edge
             try:
-                options = EdgeOptions()
-                options.add_argument("--headless")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-gpu")
+                options = _make_edge_options()
                 
                 if WEBDRIVER_MANAGER_AVAILABLE:
-                    service = EdgeService(EdgeChromiumDriverManager().install())
-                    return webdriver.Edge(service=service, options=options)
+                    service = _edge_service()
+                    return _widen_connection_pool(webdriver.Edge(service=service, options=options))
                 else:
-                    return webdriver.Edge(options=options)
+                    return _widen_connection_pool(webdriver.Edge(options=options))
                     
             except Exception as edge_error:
                 concise_error = self._extract_concise_error(edge_error)
                 print(f"Edge failed: {concise_error}")
-                return None 
\ No newline at end of file
+                return None
+
+# Pooled browsers outlive individual runs; quit them when the worker exits
+atexit.register(DynamicAutomationExecutor._drain_pool)